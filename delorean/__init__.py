@@ -17,8 +17,11 @@ from dateutil.rrule import (
 
 from delorean.dates import (
     Delorean,
+    Delta,
+    FrozenDelorean,
     datetime_timezone,
     localize,
+    localize_many,
     move_datetime_day,
     move_datetime_hour,
     move_datetime_minute,
@@ -35,15 +38,21 @@ from delorean.exceptions import (
     DeloreanInvalidTimezone,
 )
 from delorean.interface import (
+    ParseCache,
     epoch,
     flux,
     from_timestamp,
     now,
     parse,
+    parse_array,
+    parse_file,
+    parse_many,
+    parse_stats,
     range_daily,
     range_hourly,
     range_monthly,
     range_yearly,
+    reset_parse_stats,
     stops,
     utcnow,
 )
@@ -1,16 +1,14 @@
-import sys
-from datetime import datetime, timedelta, timezone
-from functools import partial, update_wrapper
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
 from operator import index
 
 import humanize
 from babel.dates import format_datetime
-from dateutil.relativedelta import relativedelta
-from tzlocal import get_localzone
 
 from .exceptions import DeloreanInvalidDatetime, DeloreanInvalidTimezone
+from .timezones import local_timezone as get_localzone
 from .timezones import timezone as get_timezone
-from .timezones import utc
+from .timezones import transitions, utc
 
 
 def get_total_second(td):
@@ -38,6 +36,141 @@ def is_datetime_instance(dt):
         raise ValueError("Please provide a datetime instance to Delorean")
 
 
+# days in each month of a common year, indexed from 1
+_MONTH_DAYS = (None, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year, month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month]
+
+
+# interned Delta objects, by the arguments they were made with and by value
+_deltas = {}
+_MAX_DELTAS = 1024
+
+
+class Delta(object):
+    """
+    An immutable shift by a number of calendar months plus a fixed length
+    of time, added to or subtracted from dates and datetimes the way a
+    `dateutil.relativedelta.relativedelta` with the same relative fields
+    would be.
+
+    Months, and years as twelve of them, move the date, keeping the day of
+    the month if the new month has it and otherwise taking its last day.
+    Weeks, days, hours, minutes, seconds and microseconds are then added as
+    one `timedelta`, on the local clock time. Unlike `relativedelta`, a
+    delta is resolved once when it is made, and equal deltas made with the
+    same arguments are the same object, so applying a common one such as
+    ``Delta(months=1)`` over and over costs only the date arithmetic.
+
+    .. testsetup::
+
+        from datetime import datetime
+        from delorean.dates import Delta
+
+    .. doctest::
+
+        >>> datetime(2015, 1, 31, 12) + Delta(months=1, hours=2)
+        datetime.datetime(2015, 2, 28, 14, 0)
+        >>> Delta(years=1) is Delta(months=12)
+        True
+
+    .. versionadded:: 2.1.0
+    """
+
+    __slots__ = ("months", "fixed")
+
+    def __new__(
+        cls,
+        years=0,
+        months=0,
+        weeks=0,
+        days=0,
+        hours=0,
+        minutes=0,
+        seconds=0,
+        microseconds=0,
+    ):
+        key = (years, months, weeks, days, hours, minutes, seconds, microseconds)
+        try:
+            return _deltas[key]
+        except (KeyError, TypeError):
+            pass
+
+        if int(years) != years or int(months) != months:
+            raise TypeError("year and month shifts require an integer")
+        total_months = int(months) + 12 * int(years)
+        fixed = timedelta(
+            weeks=weeks,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            microseconds=microseconds,
+        )
+        self = _deltas.get((total_months, fixed))
+        if self is None:
+            self = object.__new__(cls)
+            object.__setattr__(self, "months", total_months)
+            object.__setattr__(self, "fixed", fixed)
+        if len(_deltas) < _MAX_DELTAS:
+            _deltas[(total_months, fixed)] = self
+            _deltas[key] = self
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Delta objects are immutable")
+
+    def __reduce__(self):
+        return (Delta, (0, self.months, 0, 0, 0, 0, 0, self.fixed // _MICROSECOND))
+
+    def __repr__(self):
+        return "Delta(months=%r, microseconds=%r)" % (
+            self.months,
+            self.fixed // _MICROSECOND,
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, Delta):
+            return self.months == other.months and self.fixed == other.fixed
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.months, self.fixed))
+
+    def __neg__(self):
+        return Delta(months=-self.months, microseconds=-self.fixed // _MICROSECOND)
+
+    def __radd__(self, other):
+        if not isinstance(other, date):
+            return NotImplemented
+        return _add_delta(other, self.months, self.fixed)
+
+    def __rsub__(self, other):
+        if not isinstance(other, date):
+            return NotImplemented
+        return _add_delta(other, -self.months, -self.fixed)
+
+
+def _add_delta(dt, months, fixed):
+    if (fixed.seconds or fixed.microseconds) and not isinstance(dt, datetime):
+        # a date gains a time of day, as with relativedelta
+        dt = datetime.fromordinal(dt.toordinal())
+    if months:
+        year, month = divmod(dt.month - 1 + months, 12)
+        year += dt.year
+        month += 1
+        day = dt.day
+        if day > 28:
+            day = min(day, _days_in_month(year, month))
+        dt = dt.replace(year=year, month=month, day=day)
+    # always added, as relativedelta does, which also resets fold
+    return dt + fixed
+
+
 def _move_datetime(dt, direction, delta):
     """
     Move datetime given delta by given direction
@@ -53,39 +186,33 @@ def _move_datetime(dt, direction, delta):
 
 
 def move_datetime_day(dt, direction, num_shifts):
-    delta = relativedelta(days=+num_shifts)
+    delta = Delta(days=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
-def move_datetime_namedday(dt, direction, unit):
-    TOTAL_DAYS = 7
-    days = {
-        "monday": 1,
-        "tuesday": 2,
-        "wednesday": 3,
-        "thursday": 4,
-        "friday": 5,
-        "saturday": 6,
-        "sunday": 7,
-    }
-
-    current_day = days[dt.strftime("%A").lower()]
-    target_day = days[unit.lower()]
-
-    if direction == "next":
-        if current_day < target_day:
-            delta_days = target_day - current_day
-        else:
-            delta_days = (target_day - current_day) + TOTAL_DAYS
-    elif direction == "last":
+_WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
 
-        if current_day <= target_day:
-            delta_days = (current_day - target_day) + TOTAL_DAYS
-        else:
-            delta_days = current_day - target_day
 
-    delta = relativedelta(days=+delta_days)
-    return _move_datetime(dt, direction, delta)
+def move_datetime_namedday(dt, direction, unit, num_shifts=1):
+    """
+    Move datetime to the ``num_shifts``-th weekday named ``unit`` in the
+    chosen direction, never staying on the same day. Any count below one
+    moves once.
+    """
+    days = _WEEKDAYS[unit.lower()] - dt.weekday()
+    if direction == "last":
+        days = -days
+    # the first match is 1 to 7 days away, and each further one a week more
+    delta_days = (days - 1) % 7 + 1 + 7 * (max(num_shifts, 1) - 1)
+    return _move_datetime(dt, direction, timedelta(days=delta_days))
 
 
 def move_datetime_month(dt, direction, num_shifts):
@@ -93,7 +220,7 @@ def move_datetime_month(dt, direction, num_shifts):
     Move datetime 1 month in the chosen direction.
     unit is a no-op, to keep the API the same as the day case
     """
-    delta = relativedelta(months=+num_shifts)
+    delta = Delta(months=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
@@ -102,7 +229,7 @@ def move_datetime_week(dt, direction, num_shifts):
     Move datetime 1 week in the chosen direction.
     unit is a no-op, to keep the API the same as the day case
     """
-    delta = relativedelta(weeks=+num_shifts)
+    delta = Delta(weeks=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
@@ -111,25 +238,36 @@ def move_datetime_year(dt, direction, num_shifts):
     Move datetime 1 year in the chosen direction.
     unit is a no-op, to keep the API the same as the day case
     """
-    delta = relativedelta(years=+num_shifts)
+    delta = Delta(years=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
 def move_datetime_hour(dt, direction, num_shifts):
-    delta = relativedelta(hours=+num_shifts)
+    delta = Delta(hours=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
 def move_datetime_minute(dt, direction, num_shifts):
-    delta = relativedelta(minutes=+num_shifts)
+    delta = Delta(minutes=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
 def move_datetime_second(dt, direction, num_shifts):
-    delta = relativedelta(seconds=+num_shifts)
+    delta = Delta(seconds=+num_shifts)
     return _move_datetime(dt, direction, delta)
 
 
+_SHIFT_FUNCTIONS = {
+    "second": move_datetime_second,
+    "minute": move_datetime_minute,
+    "hour": move_datetime_hour,
+    "day": move_datetime_day,
+    "week": move_datetime_week,
+    "month": move_datetime_month,
+    "year": move_datetime_year,
+}
+
+
 def datetime_timezone(tz):
     """
     This method given a timezone returns a localized datetime object.
@@ -178,12 +316,236 @@ def normalize(dt, tz):
     return dt.astimezone(tz)
 
 
+_AMBIGUOUS = ("earliest", "latest", "raise", "NaT")
+_NONEXISTENT = ("shift_forward", "shift_backward", "raise")
+
+_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = _EPOCH.replace(tzinfo=timezone.utc)
+_SECOND = timedelta(seconds=1)
+_MICROSECOND = timedelta(microseconds=1)
+# further from a transition table's end than any UTC offset reaches
+_MARGIN = 2 * 86400
+
+
+def localize_many(naive_values, tz, ambiguous="earliest", nonexistent="shift_forward"):
+    """
+    Localize many naive wall-clock readings to ``tz`` at once, with an
+    explicit policy for readings a daylight saving change makes ambiguous or
+    impossible.
+
+    :param naive_values: An iterable of naive datetimes, or a NumPy
+        ``datetime64`` array of wall-clock readings.
+    :param tz: Anything `delorean.timezone` accepts.
+    :param ambiguous: What to do with a reading that happens twice because
+        the clocks went back: ``"earliest"`` takes the first occurrence,
+        ``"latest"`` the second, ``"NaT"`` gives ``None`` (``NaT`` in an
+        array) and ``"raise"`` raises `DeloreanInvalidDatetime`.
+    :param nonexistent: What to do with a reading that never happens because
+        the clocks went forward: ``"shift_forward"`` moves it to the first
+        moment after the gap, ``"shift_backward"`` to the last microsecond
+        before it, and ``"raise"`` raises `DeloreanInvalidDatetime`.
+    :returns: For an iterable, a list of aware datetimes in ``tz``, with
+        ``fold`` set on the second occurrence of an ambiguous reading. For an
+        array, a ``datetime64[us]`` array of the UTC instants.
+
+    Unlike `localize`, which handles one value and always takes the first
+    occurrence of an ambiguous reading, this looks each reading up in the
+    zone's transition table from `delorean.timezones.transitions`, so edge
+    cases are found without a zone lookup per row.
+
+    .. versionadded:: 2.1.0
+
+    .. testsetup::
+
+        from datetime import datetime
+        from delorean import localize_many
+
+    .. doctest::
+
+        >>> [dt.isoformat() for dt in localize_many(
+        ...     [datetime(2013, 3, 10, 2, 30), datetime(2013, 11, 3, 1, 30)],
+        ...     'US/Eastern', ambiguous='latest')]
+        ['2013-03-10T03:00:00-04:00', '2013-11-03T01:30:00-05:00']
+
+    """
+    if ambiguous not in _AMBIGUOUS:
+        raise ValueError(f"ambiguous must be one of {_AMBIGUOUS!r}, not {ambiguous!r}")
+    if nonexistent not in _NONEXISTENT:
+        raise ValueError(
+            f"nonexistent must be one of {_NONEXISTENT!r}, not {nonexistent!r}"
+        )
+    tz = get_timezone(tz)
+    table = transitions(tz)
+    if getattr(naive_values, "dtype", None) is not None:
+        return _localize_array(naive_values, tz, table, ambiguous, nonexistent)
+
+    edges = starts, ends, _, _ = _edges(table)
+    limit = None if table.until is None else table.until - _MARGIN
+    results = []
+    append = results.append
+    for dt in naive_values:
+        if dt.tzinfo is not None:
+            raise DeloreanInvalidDatetime("localize_many requires naive datetimes")
+        seconds = (dt - _EPOCH) // _SECOND
+        if limit is not None and seconds >= limit:
+            append(_localize_beyond(dt, tz, ambiguous, nonexistent))
+            continue
+        k = bisect_right(starts, seconds) - 1
+        if k < 0 or seconds >= ends[k]:
+            # the common case: nowhere near a transition
+            append(dt.replace(tzinfo=tz))
+        else:
+            append(_localize_edge(dt, k, tz, edges, ambiguous, nonexistent))
+    return results
+
+
+def _edges(table):
+    """
+    Return the wall-clock readings at which each transition in ``table``
+    starts and stops being ambiguous or impossible, along with the table.
+    """
+    starts = []
+    ends = []
+    for transition, before, after in zip(
+        table.transitions, table.offsets, table.offsets[1:]
+    ):
+        starts.append(transition + min(before, after))
+        ends.append(transition + max(before, after))
+    return starts, ends, table.transitions, table.offsets
+
+
+def _localize_edge(dt, k, tz, edges, ambiguous, nonexistent):
+    """
+    Localize a reading that transition ``k`` makes ambiguous or impossible.
+    """
+    _, _, transitions_, offsets = edges
+    before, after = offsets[k], offsets[k + 1]
+    if after < before:
+        return _ambiguous(dt, tz, ambiguous)
+    if nonexistent == "raise":
+        raise DeloreanInvalidDatetime(f"{dt} does not exist in {tz}")
+    if nonexistent == "shift_forward":
+        wall = _EPOCH + timedelta(seconds=transitions_[k] + after)
+    else:
+        wall = _EPOCH + timedelta(seconds=transitions_[k] + before) - _MICROSECOND
+    return wall.replace(tzinfo=tz)
+
+
+def _ambiguous(dt, tz, ambiguous):
+    if ambiguous == "earliest":
+        return dt.replace(tzinfo=tz, fold=0)
+    if ambiguous == "latest":
+        return dt.replace(tzinfo=tz, fold=1)
+    if ambiguous == "NaT":
+        return None
+    raise DeloreanInvalidDatetime(f"{dt} is ambiguous in {tz}")
+
+
+def _localize_beyond(dt, tz, ambiguous, nonexistent):
+    """
+    What `localize_many` does for a reading past the end of the transition
+    table, asking the zone itself through ``fold``.
+    """
+    first = dt.replace(tzinfo=tz, fold=0)
+    second = dt.replace(tzinfo=tz, fold=1)
+    if first.utcoffset() == second.utcoffset():
+        return first
+    if first.utcoffset() > second.utcoffset():
+        return _ambiguous(dt, tz, ambiguous)
+    if nonexistent == "raise":
+        raise DeloreanInvalidDatetime(f"{dt} does not exist in {tz}")
+
+    # find where the gap starts: the readings from there to ``dt`` are all
+    # impossible, and the zone disagrees with itself across ``fold`` on them
+    gap = second.utcoffset() - first.utcoffset()
+    low, high = dt - gap, dt
+    while high - low > _MICROSECOND:
+        middle = low + (high - low) // 2
+        if (
+            middle.replace(tzinfo=tz).utcoffset()
+            == middle.replace(tzinfo=tz, fold=1).utcoffset()
+        ):
+            low = middle
+        else:
+            high = middle
+    if nonexistent == "shift_forward":
+        return (high + gap).replace(tzinfo=tz)
+    return low.replace(tzinfo=tz)
+
+
+def _localize_array(values, tz, table, ambiguous, nonexistent):
+    import numpy
+
+    walls = values.astype("datetime64[us]").view(numpy.int64)
+    nat = numpy.isnat(values)
+    transitions_ = numpy.array(table.transitions, dtype=numpy.int64)
+    offsets = numpy.array(table.offsets, dtype=numpy.int64)
+    starts, ends, _, _ = _edges(table)
+    starts = numpy.array(starts, dtype=numpy.int64) * 1000000
+    ends = numpy.array(ends, dtype=numpy.int64) * 1000000
+
+    k = numpy.searchsorted(starts, walls, side="right") - 1
+    instants = walls - offsets[k + 1] * 1000000
+    if len(transitions_):
+        k = numpy.maximum(k, 0)
+        special = (walls >= starts[k]) & (walls < ends[k]) & ~nat
+        before = offsets[k]
+        after = offsets[k + 1]
+        overlap = special & (after < before)
+        gap = special & (after > before)
+
+        if overlap.any():
+            if ambiguous == "raise":
+                dt = values[overlap][0].item()
+                raise DeloreanInvalidDatetime(f"{dt} is ambiguous in {tz}")
+            if ambiguous == "earliest":
+                instants[overlap] = (walls - before * 1000000)[overlap]
+            elif ambiguous == "NaT":
+                nat = nat | overlap
+        if gap.any():
+            if nonexistent == "raise":
+                dt = values[gap][0].item()
+                raise DeloreanInvalidDatetime(f"{dt} does not exist in {tz}")
+            moved = transitions_[k] * 1000000
+            if nonexistent == "shift_backward":
+                moved = moved - 1
+            instants[gap] = moved[gap]
+
+    if table.until is not None:
+        limit = (table.until - _MARGIN) * 1000000
+        for i in numpy.flatnonzero((walls >= limit) & ~nat):
+            dt = _localize_beyond(
+                walls[i].item() * _MICROSECOND + _EPOCH, tz, ambiguous, nonexistent
+            )
+            if dt is None:
+                nat[i] = True
+            else:
+                instants[i] = (dt.astimezone(utc).replace(tzinfo=None) - _EPOCH) // (
+                    _MICROSECOND
+                )
+
+    instants[nat] = numpy.iinfo(numpy.int64).min
+    return instants.view("datetime64[us]")
+
+
 class Delorean(object):
     """
     The class `Delorean <Delorean>` object. This method accepts naive
     datetime objects, with a string timezone.
+
+    .. versionchanged:: 2.1.0
+        Instances keep their state in ``__slots__`` rather than a
+        ``__dict__``, which makes each one about a third smaller. They no
+        longer take arbitrary attributes or weak references; subclasses that
+        need either can declare them.
+
+        Instances are hashable, and equal objects hash alike whatever their
+        timezones. `truncate` changes the hash along with the instant, so do
+        not truncate an object while it is in a set or a dict key.
     """
 
+    __slots__ = ("_dt", "_tzinfo", "_us")
+
     _VALID_SHIFT_DIRECTIONS = ("last", "next")
     _VALID_SHIFT_UNITS = (
         "second",
@@ -206,6 +568,7 @@ class Delorean(object):
         # maybe set timezone on the way in here. if here set it if not
         # use UTC
         is_datetime_instance(datetime)
+        self._us = None
 
         if datetime:
             if is_datetime_naive(datetime):
@@ -237,20 +600,34 @@ class Delorean(object):
 
     def __eq__(self, other):
         if isinstance(other, Delorean):
-            return self.epoch == other.epoch
+            return self._microseconds() == other._microseconds()
         return False
 
+    def __hash__(self):
+        # equal objects share an instant whatever their timezones
+        return hash(self._microseconds())
+
+    def __getstate__(self):
+        # the same state instances had before they used __slots__, so old
+        # pickles still load and every pickle protocol can write one
+        return {"_dt": self._dt, "_tzinfo": self._tzinfo}
+
+    def __setstate__(self, state):
+        self._dt = state["_dt"]
+        self._tzinfo = state["_tzinfo"]
+        self._us = None
+
     def __lt__(self, other):
-        return self.epoch < other.epoch
+        return self._microseconds() < other._microseconds()
 
     def __gt__(self, other):
-        return self.epoch > other.epoch
+        return self._microseconds() > other._microseconds()
 
     def __ge__(self, other):
-        return self.epoch >= other.epoch
+        return self._microseconds() >= other._microseconds()
 
     def __le__(self, other):
-        return self.epoch <= other.epoch
+        return self._microseconds() <= other._microseconds()
 
     def __ne__(self, other):
         return not self == other
@@ -272,37 +649,12 @@ class Delorean(object):
                 "Delorean objects can only be subtracted with timedelta or other Delorean objects"
             )
 
-    def __getattr__(self, name):
-        """
-        Implement __getattr__ to call `shift_date` function when function
-        called does not exist
-        """
-        func_parts = name.split("_")
-        # is the func we are trying to call the right length?
-        if len(func_parts) != 2:
-            raise AttributeError
-
-        # is the function we are trying to call valid?
-        if (
-            func_parts[0] not in self._VALID_SHIFT_DIRECTIONS
-            or func_parts[1] not in self._VALID_SHIFT_UNITS
-        ):
-            raise AttributeError
-
-        # dispatch our function
-        func = partial(self._shift_date, func_parts[0], func_parts[1])
-        # update our partial with self.shift_date attributes
-        update_wrapper(func, self._shift_date)
-        return func
-
     def _shift_date(self, direction, unit, *args):
         """
         Shift datetime in `direction` in _VALID_SHIFT_DIRECTIONS and by some
         unit in _VALID_SHIFTS and shift that amount by some multiple,
         defined by by args[0] if it exists
         """
-        this_module = sys.modules[__name__]
-
         num_shifts = 1
         if len(args) > 0:
             if unit == "second":
@@ -313,26 +665,71 @@ class Delorean(object):
                 except TypeError:
                     raise TypeError(f"{unit} shifts require an integer") from None
 
-        if unit in [
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-        ]:
-            shift_func = move_datetime_namedday
-            dt = shift_func(self._dt, direction, unit)
-            if num_shifts > 1:
-                for n in range(num_shifts - 1):
-                    dt = shift_func(dt, direction, unit)
+        shift_func = _SHIFT_FUNCTIONS.get(unit)
+        if shift_func is None:
+            dt = move_datetime_namedday(self._dt, direction, unit, num_shifts)
         else:
-            shift_func = getattr(this_module, "move_datetime_%s" % unit)
             dt = shift_func(self._dt, direction, num_shifts)
 
         return Delorean(datetime=dt.replace(tzinfo=None), timezone=self.timezone)
 
+    def shift_by(
+        self,
+        years=0,
+        months=0,
+        weeks=0,
+        days=0,
+        hours=0,
+        minutes=0,
+        seconds=0,
+        microseconds=0,
+        weekday=None,
+    ):
+        """
+        Returns a new `Delorean` object moved by all of the given amounts at
+        once, which may be negative. This object is left unchanged.
+
+        Like `dateutil.relativedelta.relativedelta`, years and months are
+        added first, keeping the day of the month where it exists and
+        otherwise taking the month's last day; then the remaining units are
+        added to the local clock time. ``weekday`` then moves to a weekday,
+        as either a number with Monday as 0, or a `dateutil` weekday such as
+        ``FR`` or ``FR(-2)``: ``FR`` and ``FR(+1)`` stay on a Friday or move
+        on to the next, ``FR(-1)`` stays or moves back to the last, and
+        ``FR(+2)`` goes a week further.
+
+        .. testsetup::
+
+            from datetime import datetime
+            from delorean import Delorean
+
+        .. doctest::
+
+            >>> d = Delorean(datetime(2015, 1, 31, 12), timezone='US/Pacific')
+            >>> d.shift_by(months=1, hours=-12)
+            Delorean(datetime=datetime.datetime(2015, 2, 28, 0, 0), timezone='US/Pacific')
+            >>> from dateutil.relativedelta import FR
+            >>> d.shift_by(weeks=-1, weekday=FR(-1))
+            Delorean(datetime=datetime.datetime(2015, 1, 23, 12, 0), timezone='US/Pacific')
+
+        .. versionadded:: 2.1.0
+
+        """
+        dt = self._dt.replace(tzinfo=None) + Delta(
+            years, months, weeks, days, hours, minutes, seconds, microseconds
+        )
+
+        if weekday is not None:
+            target = getattr(weekday, "weekday", weekday)
+            n = getattr(weekday, "n", None) or 1
+            if n > 0:
+                jump = (target - dt.weekday()) % 7 + 7 * (n - 1)
+            else:
+                jump = -((dt.weekday() - target) % 7) + 7 * (n + 1)
+            dt += timedelta(days=jump)
+
+        return Delorean(datetime=dt, timezone=self.timezone)
+
     @property
     def timezone(self):
         """
@@ -398,6 +795,7 @@ class Delorean(object):
         else:
             raise ValueError("Invalid truncation level")
 
+        self._us = None
         return self
 
     @property
@@ -543,9 +941,14 @@ class Delorean(object):
             Delorean(datetime=datetime.datetime(2015, 2, 28, 23, 59, 59, 999999), timezone='UTC')
 
         """
-        end = self._dt.replace(
-            hour=23, minute=59, second=59, microsecond=999999
-        ) + relativedelta(day=31)
+        dt = self._dt
+        end = dt.replace(
+            day=_days_in_month(dt.year, dt.month),
+            hour=23,
+            minute=59,
+            second=59,
+            microsecond=999999,
+        )
         return Delorean(datetime=end, timezone=self.timezone)
 
     @property
@@ -619,6 +1022,7 @@ class Delorean(object):
             self._tzinfo = get_timezone(timezone)
         except DeloreanInvalidTimezone:
             raise DeloreanInvalidTimezone("Provide a valid timezone") from None
+        # the instant is unchanged, so the cached microseconds still hold
         self._dt = self._dt.astimezone(self._tzinfo)
         self._tzinfo = self._dt.tzinfo
         return self
@@ -641,10 +1045,45 @@ class Delorean(object):
             1420099200.0
 
         """
-        epoch_sec = datetime.fromtimestamp(0, timezone.utc)
-        now_sec = self._dt.astimezone(utc)
-        delta_sec = now_sec - epoch_sec
-        return get_total_second(delta_sec)
+        seconds, microseconds = divmod(self._microseconds(), 1000000)
+        # the same arithmetic as get_total_second, so results match it exactly
+        return (microseconds + seconds * 1e6) / 1e6
+
+    def sort_key(self):
+        """
+        Returns the instant of the Delorean object as an integer number of
+        microseconds since the Unix epoch, for ordering, grouping and
+        deduplicating Delorean objects as cheaply as integers. Objects for
+        the same instant in different timezones have the same key.
+
+        .. testsetup::
+
+            from datetime import datetime
+            from delorean import Delorean
+
+        .. doctest::
+
+            >>> d = Delorean(datetime(2015, 1, 1), timezone='US/Pacific')
+            >>> d.sort_key()
+            1420099200000000
+            >>> events = [d, Delorean(datetime(2015, 1, 1), timezone='UTC')]
+            >>> sorted(events, key=Delorean.sort_key)[0].timezone
+            zoneinfo.ZoneInfo(key='UTC')
+
+        .. versionadded:: 2.1.0
+
+        """
+        return self._microseconds()
+
+    def _microseconds(self):
+        """
+        Return the instant as an integer count of microseconds since the
+        Unix epoch, computed once and kept until `truncate` changes it.
+        """
+        us = self._us
+        if us is None:
+            us = self._us = (self._dt - _UTC_EPOCH) // _MICROSECOND
+        return us
 
     @property
     def epoch(self):
@@ -772,3 +1211,189 @@ class Delorean(object):
 
         """
         return format_datetime(self._dt, format=format, locale=locale)
+
+
+def _shift_method(direction, unit):
+    """
+    Build the `Delorean` method that shifts to the ``direction`` ``unit``,
+    such as ``next_day`` or ``last_friday``.
+    """
+
+    def shift(self, num_shifts=1):
+        return self._shift_date(direction, unit, num_shifts)
+
+    shift.__name__ = f"{direction}_{unit}"
+    shift.__qualname__ = f"Delorean.{shift.__name__}"
+    if unit in _SHIFT_FUNCTIONS:
+        way = "after" if direction == "next" else "before"
+        shift.__doc__ = (
+            f"Returns a new `Delorean` object ``num_shifts`` {unit}s {way} this"
+            " one, by default one."
+        )
+    else:
+        shift.__doc__ = (
+            f"Returns a new `Delorean` object for the {direction}"
+            f" {unit.capitalize()}, or the ``num_shifts``-th {direction} one."
+        )
+    return shift
+
+
+for _direction in Delorean._VALID_SHIFT_DIRECTIONS:
+    for _unit in Delorean._VALID_SHIFT_UNITS:
+        setattr(Delorean, f"{_direction}_{_unit}", _shift_method(_direction, _unit))
+del _direction, _unit
+
+
+def _freeze(value):
+    """
+    Return ``value`` as a `FrozenDelorean` if it is a `Delorean`, and
+    unchanged otherwise.
+    """
+    if not isinstance(value, Delorean) or isinstance(value, FrozenDelorean):
+        return value
+    return _frozen_copy(value)
+
+
+def _frozen_copy(d):
+    frozen = object.__new__(FrozenDelorean)
+    frozen._dt = d._dt
+    frozen._tzinfo = d._tzinfo
+    frozen._us = d._us
+    frozen._memo = None
+    return frozen
+
+
+def _memoized(compute, name):
+    """
+    Wrap the `Delorean` property getter ``compute`` so that a
+    `FrozenDelorean` computes it once and keeps the result.
+    """
+
+    def get(self):
+        memo = self._memo
+        if memo is None:
+            memo = self._memo = {}
+        try:
+            return memo[name]
+        except KeyError:
+            value = memo[name] = _freeze(compute(self))
+            return value
+
+    return property(get, doc=compute.__doc__)
+
+
+class FrozenDelorean(Delorean):
+    """
+    A `Delorean` that never changes, made the same way.
+
+    Methods that change a `Delorean` in place, `truncate` and `shift`,
+    return a new object instead, `naive` leaves this one as it is, and
+    every method that returns a new object returns a `FrozenDelorean`.
+    Since nothing can change it, a frozen object computes each derived
+    value, such as `timestamp`, `date`, `midnight`, `end_of_month` or a
+    `format_datetime` string, at most once, and is safe to cache and share.
+
+    .. testsetup::
+
+        from datetime import datetime
+        from delorean import FrozenDelorean
+
+    .. doctest::
+
+        >>> d = FrozenDelorean(datetime(2015, 1, 1, 12, 10), timezone='US/Pacific')
+        >>> d.truncate('hour')
+        FrozenDelorean(datetime=datetime.datetime(2015, 1, 1, 12, 0), timezone='US/Pacific')
+        >>> d
+        FrozenDelorean(datetime=datetime.datetime(2015, 1, 1, 12, 10), timezone='US/Pacific')
+        >>> d.end_of_month is d.end_of_month
+        True
+
+    .. versionadded:: 2.1.0
+    """
+
+    __slots__ = ("_memo",)
+
+    def __init__(self, datetime=None, timezone=None):
+        super().__init__(datetime, timezone)
+        self._memo = None
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._memo = None
+
+    def __repr__(self):
+        memo = self._memo
+        if memo is None:
+            memo = self._memo = {}
+        try:
+            return memo["repr"]
+        except KeyError:
+            text = memo["repr"] = "Frozen" + Delorean.__repr__(self)
+            return text
+
+    def __add__(self, other):
+        return _freeze(Delorean.__add__(self, other))
+
+    def __sub__(self, other):
+        return _freeze(Delorean.__sub__(self, other))
+
+    def _shift_date(self, direction, unit, *args):
+        return _freeze(Delorean._shift_date(self, direction, unit, *args))
+
+    def shift_by(self, *args, **kwargs):
+        return _freeze(Delorean.shift_by(self, *args, **kwargs))
+
+    shift_by.__doc__ = Delorean.shift_by.__doc__
+
+    def replace(self, **kwargs):
+        return _freeze(Delorean.replace(self, **kwargs))
+
+    replace.__doc__ = Delorean.replace.__doc__
+
+    def truncate(self, s):
+        """
+        Returns a new `FrozenDelorean` object truncated to the nearest s
+        (second, minute, hour, day, month, year). This object is left
+        unchanged.
+        """
+        return Delorean.truncate(_frozen_copy(self), s)
+
+    def shift(self, timezone):
+        """
+        Returns a new `FrozenDelorean` object for the same instant in the
+        specified timezone. This object is left unchanged.
+        """
+        return Delorean.shift(_frozen_copy(self), timezone)
+
+    def _naive(self):
+        """
+        Returns a naive datetime object for the UTC time of this object,
+        which is left unchanged.
+        """
+        return self._dt.astimezone(utc).replace(tzinfo=None)
+
+    naive = _memoized(_naive, "naive")
+    del _naive
+
+    timestamp = _memoized(Delorean.timestamp.fget, "timestamp")
+    date = _memoized(Delorean.date.fget, "date")
+    midnight = _memoized(Delorean.midnight.fget, "midnight")
+    start_of_day = midnight
+    end_of_day = _memoized(Delorean.end_of_day.fget, "end_of_day")
+    start_of_month = _memoized(Delorean.start_of_month.fget, "start_of_month")
+    end_of_month = _memoized(Delorean.end_of_month.fget, "end_of_month")
+    start_of_year = _memoized(Delorean.start_of_year.fget, "start_of_year")
+    end_of_year = _memoized(Delorean.end_of_year.fget, "end_of_year")
+
+    def format_datetime(self, format="medium", locale="en_US"):
+        memo = self._memo
+        if memo is None:
+            memo = self._memo = {}
+        key = ("format_datetime", format, locale)
+        try:
+            return memo[key]
+        except KeyError:
+            text = memo[key] = Delorean.format_datetime(self, format, locale)
+            return text
+
+    format_datetime.__doc__ = Delorean.format_datetime.__doc__
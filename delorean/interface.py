@@ -1,15 +1,39 @@
-from datetime import datetime, timezone
+import csv
+import json
+import mmap
+import os
+import time
+import warnings
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from datetime import timezone as fixed_offset
+from functools import lru_cache, partial
+from itertools import chain, islice
+from threading import Lock
 
+from dateutil.parser import UnknownTimezoneWarning, parserinfo
 from dateutil.parser import isoparse as isocapture
 from dateutil.parser import parse as capture
 from dateutil.rrule import DAILY, HOURLY, MONTHLY, YEARLY, rrule
+from dateutil.tz import UTC as dateutil_utc
 from dateutil.tz import tzlocal, tzoffset
-from tzlocal import get_localzone
 
-from .dates import Delorean, datetime_timezone, is_datetime_naive
+from .dates import Delorean, datetime_timezone, is_datetime_naive, localize
 from .exceptions import DeloreanInvalidDatetime
+from .parsers import (
+    COMMON_FORMATS,
+    classify,
+    compile_format,
+    epoch_microseconds,
+    iso_fields,
+    parse_epoch,
+    parse_formats,
+    parse_iso,
+)
+from .timezones import _apply_settings, _settings, abbreviations, utc
+from .timezones import local_timezone as get_localzone
 from .timezones import timezone as get_timezone
-from .timezones import utc
 
 
 def parse(
@@ -20,11 +44,18 @@ def parse(
     yearfirst=True,
     *,
     assume_timezone="UTC",
+    formats=None,
+    epoch_unit=None,
+    offset=0,
+    length=None,
 ):
     """
     Parse a datetime string and return a `Delorean` object.
 
-    :param datetime_str: The string to interpret.
+    :param datetime_str: The string to interpret. It may also be `bytes`,
+        `bytearray` or `memoryview` holding UTF-8 text. RFC 3339 timestamps
+        and epoch numbers are read from these in place. Anything else is
+        decoded first.
     :param timezone: Force the parsed clock reading into this timezone. Any
         offset in ``datetime_str`` is discarded. To supply a timezone only
         when the string has none, use ``assume_timezone`` instead.
@@ -38,6 +69,22 @@ def parse(
         ``datetime_str`` contains no timezone or UTC offset. It defaults to
         ``"UTC"`` for compatibility with earlier versions. Pass ``None`` to
         assume nothing, which turns timezone-less input into an error.
+    :param formats: A `strptime` format string, or a sequence of them, that
+        ``datetime_str`` is expected to follow. They are tried in order before
+        any general-purpose parsing, and each is compiled once and cached, so
+        a feed with a known layout skips the guesswork entirely. A string that
+        follows none of them is parsed as if ``formats`` were not given.
+    :param epoch_unit: Read a string that is just a decimal number, such as
+        ``"1420070400"``, as a Unix timestamp in UTC: ``"s"``, ``"ms"``,
+        ``"us"`` or ``"ns"`` since the epoch, or ``"auto"`` to judge the unit
+        from the number of digits. Such strings are converted with exact
+        integer arithmetic before any other parsing is tried. Other strings
+        are parsed as usual.
+    :param offset: Where the timestamp starts in ``datetime_str``, in
+        characters or bytes. This is not a UTC offset.
+    :param length: How long the timestamp is, or ``None`` to read to the end.
+        Together with ``offset`` this picks a timestamp out of a larger
+        string or buffer, such as a log line, without slicing it.
     :raises DeloreanInvalidDatetime: If the string contains no timezone and
         ``assume_timezone`` is ``None``. `DeloreanInvalidDatetime` is a
         `ValueError`, as is the error raised for an unreadable string.
@@ -46,6 +93,10 @@ def parse(
         The ``assume_timezone`` parameter makes the existing UTC assumption
         configurable and allows strict handling of timezone-less input.
 
+    .. versionadded:: 2.1.0
+        The ``formats``, ``epoch_unit``, ``offset`` and ``length``
+        parameters, and binary input.
+
     .. testsetup::
 
         from delorean import Delorean
@@ -100,17 +151,188 @@ def parse(
         >>> parse('2015-01-01 00:01:02 -0500', timezone='US/Pacific')
         Delorean(datetime=datetime.datetime(2015, 1, 1, 0, 1, 2), timezone='US/Pacific')
 
+    When every string in a feed has the same layout, say so with ``formats``.
+    Month and weekday names in a format are read in English whatever the
+    locale.
+
+    .. doctest::
+
+        >>> parse('10/Oct/2000:13:55:36 -0700', formats='%d/%b/%Y:%H:%M:%S %z')
+        Delorean(datetime=datetime.datetime(2000, 10, 10, 13, 55, 36), timezone='UTC-07:00')
+
+    Zone abbreviations such as ``"EST"`` or ``"CEST"`` are read as the fixed
+    offsets they stand for, from the table in
+    `delorean.timezones.abbreviations`. Where an abbreviation means different
+    things in different places, `delorean.timezones.set_abbreviation_regions`
+    picks the meaning.
+
+    Feeds that carry Unix timestamps instead of text can say so with
+    ``epoch_unit``.
+
+    .. doctest::
+
+        >>> parse('1420070400123', epoch_unit='ms')
+        Delorean(datetime=datetime.datetime(2015, 1, 1, 0, 0, 0, 123000), timezone='UTC')
+
+    A timestamp inside a binary record can be parsed where it lies.
+
+    .. doctest::
+
+        >>> line = b'INFO 2015-01-01T00:01:02Z request served'
+        >>> parse(line, offset=5, length=20)
+        Delorean(datetime=datetime.datetime(2015, 1, 1, 0, 1, 2), timezone='UTC')
+
+    """
+    dt = _parse_datetime(
+        datetime_str,
+        formats,
+        isofirst,
+        dayfirst,
+        yearfirst,
+        epoch_unit,
+        offset,
+        length,
+    )
+    return _as_delorean(dt, timezone, assume_timezone)
+
+
+# How many strings `parse` has sent down each route; see `parse_stats`.
+_routes = Counter()
+
+
+def _parse_datetime(
+    datetime_str,
+    formats,
+    isofirst,
+    dayfirst,
+    yearfirst,
+    epoch_unit=None,
+    offset=0,
+    length=None,
+    routes=_routes,
+):
     """
-    # parse string to datetime object
-    dt = None
-    if isofirst:
+    Return the datetime `parse` reads from a string, before any timezone
+    handling, counting the route it took in ``routes``: by default the
+    counts `parse_stats` reports.
+    """
+    end = None if length is None else offset + length
+    if epoch_unit:
+        dt = parse_epoch(datetime_str, epoch_unit, offset, end)
+        if dt is not None:
+            routes["epoch"] += 1
+            return dt
+
+    if offset or end is not None or not isinstance(datetime_str, str):
+        # the built-in RFC 3339 reader works on bytes and slices in place;
+        # everything after it needs a string of its own
+        if isofirst and not formats:
+            dt = parse_iso(datetime_str, offset, end)
+            if dt is not None:
+                routes["rfc3339"] += 1
+                return dt
+        datetime_str = _decode(datetime_str, offset, end)
+
+    # parse string to datetime object, trying the caller's formats first and
+    # then whichever parser the string's shape points to, so dateutil's ISO
+    # parser is only tried on strings it might accept
+    if formats:
+        dt = parse_formats(datetime_str, formats)
+        if dt is not None:
+            routes["formats"] += 1
+            return dt
+
+    route = classify(datetime_str) if isofirst else "generic"
+    routes[route] += 1
+    if route == "rfc3339":
+        dt = parse_iso(datetime_str)
+        if dt is not None:
+            return dt
+    if route != "generic":
         try:
-            dt = isocapture(datetime_str)
+            return isocapture(datetime_str)
         except Exception:
-            pass
-    if dt is None:
-        dt = capture(datetime_str, dayfirst=dayfirst, yearfirst=yearfirst)
+            routes["fallback"] += 1
+    return capture(
+        datetime_str, dayfirst=dayfirst, yearfirst=yearfirst, tzinfos=_abbreviation_zone
+    )
+
+
+def _abbreviation_zone(name, offset):
+    """
+    Return the zone for a parsed zone ``name`` and numeric ``offset``, as
+    dateutil's ``tzinfos`` callable. A numeric offset wins over whatever the
+    name, often just a comment such as ``(IST)``, would mean; names are
+    looked up in `abbreviations` only when the string has no offset. Local
+    and unknown names get what dateutil gives them without ``tzinfos``.
+    """
+    if name in time.tzname and (
+        offset is None
+        # dateutil gives names such as "UTC" an offset of 0 itself; where
+        # the local zone goes by that name all year, it is the local zone
+        or (offset == 0 and name in parserinfo.UTCZONE and not time.daylight)
+    ):
+        return tzlocal()
+    if offset is not None:
+        return dateutil_utc if offset == 0 else tzoffset(name, offset)
+    if name is None:
+        return None
+    zone = abbreviations().get(name)
+    if zone is None:
+        warnings.warn(
+            "tzname {} identified but not understood.  Pass `tzinfos` argument "
+            "in order to correctly return a timezone-aware datetime.  In a "
+            "future version, this will raise an exception.".format(name),
+            category=UnknownTimezoneWarning,
+        )
+    return zone
 
+
+def _decode(value, offset=0, end=None):
+    """
+    Return the text of ``value`` from ``offset`` to ``end``, decoding
+    `bytes`, `bytearray` and `memoryview` as UTF-8. Other types are returned
+    as they are, for the parsers to reject.
+    """
+    if isinstance(value, str):
+        return value[offset:end] if offset or end is not None else value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return str(memoryview(value)[offset:end], "utf-8")
+    return value
+
+
+def parse_stats():
+    """
+    Return how many strings `parse` and its relatives have routed each way
+    since the last `reset_parse_stats`.
+
+    The keys are ``"epoch"`` for numbers read with ``epoch_unit``,
+    ``"formats"`` for strings read with a caller's format, and the routes of
+    `delorean.parsers.classify`: ``"rfc3339"`` for the built-in RFC 3339
+    reader, ``"iso"`` for `dateutil`'s ISO parser and ``"generic"``
+    for its general-purpose parser. ``"fallback"`` counts strings an ISO
+    route sent to `dateutil`'s ISO parser that it then rejected. A high count
+    there means the classifier is guessing badly for your input.
+
+    .. versionadded:: 2.1.0
+    """
+    return dict(_routes)
+
+
+def reset_parse_stats():
+    """
+    Zero the counts `parse_stats` reports.
+
+    .. versionadded:: 2.1.0
+    """
+    _routes.clear()
+
+
+def _as_delorean(dt, timezone, assume_timezone):
+    """
+    Wrap a parsed datetime in a `Delorean`, applying `parse`'s ``timezone``
+    and ``assume_timezone`` rules.
+    """
     if timezone:
         dt = dt.replace(tzinfo=None)
         do = Delorean(datetime=dt, timezone=timezone)
@@ -120,6 +342,10 @@ def parse(
                 "datetime string has no timezone and assume_timezone is None"
             )
         do = Delorean(datetime=dt, timezone=assume_timezone)
+    elif dt.tzinfo is utc or isinstance(dt.tzinfo, fixed_offset):
+        # already one of delorean's own timezone types, as the ISO fast path
+        # produces, so there is nothing to convert
+        do = Delorean(datetime=dt)
     elif isinstance(dt.tzinfo, tzoffset):
         tz = get_timezone(dt.tzinfo)
         dt = dt.replace(tzinfo=None)
@@ -139,6 +365,883 @@ def parse(
     return do
 
 
+def _same_reading(a, b):
+    """
+    Whether two parsed datetimes agree on clock reading and offset, whatever
+    tzinfo types carry the offset.
+    """
+    return a.replace(tzinfo=None) == b.replace(tzinfo=None) and (
+        a.utcoffset() == b.utcoffset()
+    )
+
+
+def infer_format(
+    samples,
+    isofirst=True,
+    dayfirst=True,
+    yearfirst=True,
+    epoch_unit=None,
+    offset=0,
+    length=None,
+):
+    """
+    Return the layout every one of ``samples`` follows, or ``None``.
+
+    Candidates are the RFC 3339 layout, reported as ``"iso"``, followed by
+    the `strptime` formats in `delorean.parsers.COMMON_FORMATS` that order
+    day, month and year as `parse` does with the same ``isofirst``,
+    ``dayfirst`` and ``yearfirst``. A candidate is only chosen if it also
+    reads each sample exactly as `parse` would, so locking it in never
+    changes a result, even for later strings the samples did not cover.
+    Samples `parse` cannot read are ignored, as are epoch numbers when
+    ``epoch_unit`` is given, since those never reach a format. Binary
+    samples, and the ``offset`` and ``length`` to read them at, are handled
+    as `parse` handles them.
+    """
+    end = None if length is None else offset + length
+    expected = {}
+    for value in samples:
+        if (
+            epoch_unit
+            and epoch_microseconds(value, epoch_unit, offset, end) is not None
+        ):
+            continue
+        try:
+            text = _decode(value, offset, end)
+            expected[text] = _parse_datetime(text, None, isofirst, dayfirst, yearfirst)
+        except (ValueError, OverflowError, TypeError):
+            pass
+    if not expected:
+        return None
+
+    for format in _candidates(isofirst, dayfirst, yearfirst):
+        matcher = _matcher(format)
+        for text, dt in expected.items():
+            try:
+                found = matcher(text)
+            except TypeError:
+                found = None
+            if found is None or not _same_reading(found, dt):
+                break
+        else:
+            return format
+    return None
+
+
+# A reading whose day and month could be swapped, as could its year and day
+# on some orders, so a layout that reads it as `parse` does cannot disagree
+# with `parse` on any other string in that layout.
+_PROBE = datetime(2009, 5, 6, 10, 11, 12, tzinfo=fixed_offset(timedelta(hours=2)))
+
+
+@lru_cache(maxsize=None)
+def _candidates(isofirst, dayfirst, yearfirst):
+    """
+    Return the layouts `infer_format` may choose with these settings: those
+    that read `_PROBE`, written in the layout, exactly as `parse` does.
+    """
+    candidates = ["iso"] if isofirst else []
+    # probing is not parsing the caller asked for, so it goes uncounted
+    routes = Counter()
+    for format in COMMON_FORMATS:
+        text = _PROBE.strftime(format)
+        try:
+            expected = _parse_datetime(
+                text, None, isofirst, dayfirst, yearfirst, routes=routes
+            )
+        except (ValueError, OverflowError):
+            continue
+        found = _matcher(format)(text)
+        if found is not None and _same_reading(found, expected):
+            candidates.append(format)
+    return tuple(candidates)
+
+
+def _matcher(formats, epoch_unit=None):
+    """
+    Return a function reading a string in ``formats``, which is ``"iso"``,
+    a `strptime` format, or a sequence of them, or returning ``None``.
+    With ``epoch_unit``, epoch numbers are read first. Returns ``None`` if
+    there is nothing to match.
+    """
+    if formats == "iso":
+        read = parse_iso
+    elif isinstance(formats, str):
+        read = compile_format(formats).match
+    elif formats:
+        read = partial(parse_formats, formats=formats)
+    else:
+        read = None
+    if not epoch_unit:
+        return read
+
+    read_epoch = partial(parse_epoch, unit=epoch_unit)
+    if read is None:
+        return read_epoch
+
+    def read_epoch_first(text):
+        dt = read_epoch(text)
+        return read(text) if dt is None else dt
+
+    return read_epoch_first
+
+
+class ParseStream(object):
+    """
+    The iterator `parse_many` returns.
+
+    Besides yielding `Delorean` objects it records what happened along the
+    way: ``format`` is the layout in use, or ``None`` before the sample has
+    been read or if no single layout fits it, and ``errors`` lists
+    ``(index, exception)`` for each string that could not be parsed when
+    ``errors="collect"``.
+    """
+
+    def __init__(
+        self,
+        strings,
+        timezone=None,
+        isofirst=True,
+        dayfirst=True,
+        yearfirst=True,
+        *,
+        assume_timezone="UTC",
+        formats=None,
+        epoch_unit=None,
+        offset=0,
+        length=None,
+        sample=20,
+        errors="raise",
+    ):
+        if errors not in ("raise", "skip", "collect"):
+            raise ValueError(
+                f"errors must be 'raise', 'skip' or 'collect', not {errors!r}"
+            )
+        self.format = None
+        self.errors = []
+        self._results = self._parse(
+            iter(strings),
+            timezone,
+            isofirst,
+            dayfirst,
+            yearfirst,
+            assume_timezone,
+            formats,
+            epoch_unit,
+            offset,
+            length,
+            sample,
+            errors,
+        )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._results)
+
+    def _parse(
+        self,
+        strings,
+        timezone,
+        isofirst,
+        dayfirst,
+        yearfirst,
+        assume_timezone,
+        formats,
+        epoch_unit,
+        offset,
+        length,
+        sample,
+        errors,
+    ):
+        head = list(islice(strings, sample))
+        self.format = formats or infer_format(
+            head, isofirst, dayfirst, yearfirst, epoch_unit, offset, length
+        )
+        matcher = _matcher(self.format, epoch_unit)
+        end = None if length is None else offset + length
+        sliced = offset or end is not None
+
+        for index, value in enumerate(chain(head, strings)):
+            try:
+                if sliced or not isinstance(value, str):
+                    dt = _read_in_place(value, self.format, epoch_unit, offset, end)
+                    text = None if dt is not None else _decode(value, offset, end)
+                else:
+                    dt = None
+                    text = value
+                if text is not None and matcher:
+                    dt = matcher(text)
+                if dt is None:
+                    dt = _parse_datetime(
+                        text, None, isofirst, dayfirst, yearfirst, epoch_unit
+                    )
+                do = _as_delorean(dt, timezone, assume_timezone)
+            except (ValueError, OverflowError, TypeError) as e:
+                if errors == "raise":
+                    raise
+                if errors == "collect":
+                    self.errors.append((index, e))
+                continue
+            yield do
+
+
+def parse_many(
+    strings,
+    timezone=None,
+    isofirst=True,
+    dayfirst=True,
+    yearfirst=True,
+    *,
+    assume_timezone="UTC",
+    formats=None,
+    epoch_unit=None,
+    offset=0,
+    length=None,
+    sample=20,
+    errors="raise",
+):
+    """
+    Lazily parse an iterable of datetime strings, yielding `Delorean` objects.
+
+    Each result is the one `parse` would return for that string with the same
+    arguments. The difference is speed on uniform input: the first ``sample``
+    strings are used to pick one layout for the whole stream, and every later
+    string is read with that layout directly, falling back to the full `parse`
+    logic only for strings that do not follow it.
+
+    :param strings: Any iterable of strings, or of the binary types `parse`
+        accepts. It is consumed lazily, apart from the first ``sample``
+        items, which are read before anything is yielded.
+    :param offset: As for `parse`, applied to every item, for records that
+        keep their timestamp in a fixed position.
+    :param length: As for `parse`, applied to every item.
+    :param formats: As for `parse`. When given, no layout is inferred and
+        these formats are used instead.
+    :param sample: How many leading strings to infer the layout from.
+    :param errors: What to do with a string that cannot be parsed:
+        ``"raise"`` stops the stream with the error, ``"skip"`` leaves it out,
+        and ``"collect"`` leaves it out and records its index and error in the
+        returned stream's ``errors`` list.
+    :returns: A `ParseStream`, which iterates like a generator.
+
+    The remaining arguments mean the same as for `parse`.
+
+    .. versionadded:: 2.1.0
+
+    .. testsetup::
+
+        from delorean import parse_many
+
+    .. doctest::
+
+        >>> stream = parse_many(['2015-01-01T00:00:00Z', 'soon', '2015-01-02T00:00:00Z'], errors='collect')
+        >>> [d.date for d in stream]
+        [datetime.date(2015, 1, 1), datetime.date(2015, 1, 2)]
+        >>> stream.format
+        'iso'
+        >>> [index for index, error in stream.errors]
+        [1]
+
+    """
+    return ParseStream(
+        strings,
+        timezone,
+        isofirst,
+        dayfirst,
+        yearfirst,
+        assume_timezone=assume_timezone,
+        formats=formats,
+        epoch_unit=epoch_unit,
+        offset=offset,
+        length=length,
+        sample=sample,
+        errors=errors,
+    )
+
+
+ParsedArray = namedtuple("ParsedArray", ["instants", "offsets"])
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+_SECOND = timedelta(seconds=1)
+# the instants a datetime can hold, in microseconds since the epoch
+_MIN_INSTANT = (datetime.min - _EPOCH) // _MICROSECOND
+_MAX_INSTANT = (datetime.max - _EPOCH) // _MICROSECOND
+# the integer NumPy stores for NaT in a datetime64 array
+_NAT = -(2**63)
+
+
+def parse_array(
+    strings,
+    timezone=None,
+    isofirst=True,
+    dayfirst=True,
+    yearfirst=True,
+    *,
+    assume_timezone="UTC",
+    formats=None,
+    epoch_unit=None,
+    offset=0,
+    length=None,
+    sample=20,
+    errors="raise",
+):
+    """
+    Parse an iterable of datetime strings into NumPy arrays rather than
+    `Delorean` objects.
+
+    Returns a `ParsedArray` of two arrays the same length as ``strings``:
+    ``instants``, a ``datetime64[us]`` array of the instants in UTC, and
+    ``offsets``, an ``int32`` array of each string's UTC offset in seconds,
+    so ``instants + offsets`` recovers the local clock readings. Each row
+    holds exactly what `parse` would return for that string with the same
+    arguments, including how ``timezone`` and ``assume_timezone`` apply, and
+    the layout is inferred from the first ``sample`` strings as it is for
+    `parse_many`. No `Delorean` objects are created along the way.
+
+    :param errors: ``"raise"`` to stop at the first string that cannot be
+        parsed, or ``"coerce"`` to store ``NaT`` and an offset of 0 for it.
+    :raises ImportError: If NumPy is not installed. It is an optional
+        dependency, installed with ``pip install 'delorean[numpy]'``.
+
+    The remaining arguments mean the same as for `parse_many`.
+
+    .. versionadded:: 2.1.0
+
+    .. testsetup::
+
+        from delorean import parse_array
+
+    .. doctest::
+
+        >>> parsed = parse_array(['2015-01-01T00:00:00-08:00', 'soon'], errors='coerce')
+        >>> parsed.instants
+        array(['2015-01-01T08:00:00.000000',                        'NaT'],
+              dtype='datetime64[us]')
+        >>> parsed.offsets
+        array([-28800,      0], dtype=int32)
+
+    """
+    numpy = _numpy("parse_array")
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+
+    # resolve the zones once rather than once per row
+    timezone = get_timezone(timezone) if timezone else None
+    if assume_timezone is not None:
+        assume_timezone = get_timezone(assume_timezone)
+
+    strings = iter(strings)
+    head = list(islice(strings, sample))
+    formats = formats or infer_format(
+        head, isofirst, dayfirst, yearfirst, epoch_unit, offset, length
+    )
+    matcher = _matcher(formats, epoch_unit)
+    end = None if length is None else offset + length
+    # epoch numbers are UTC instants already, unless ``timezone`` moves them
+    read_epoch = None if timezone else epoch_unit
+
+    # RFC 3339 rows can skip datetime objects entirely and go straight from
+    # fields to integers, as long as the offset that applies to them never
+    # needs a zone lookup: it is written in the string, or the zone that
+    # applies instead is a fixed offset.
+    if formats == "iso" and (not timezone or _is_fixed(timezone)):
+        read_fields = iso_fields
+    else:
+        read_fields = None
+    if timezone:
+        fixed = _fixed_seconds(timezone)
+    elif assume_timezone is not None:
+        fixed = _fixed_seconds(assume_timezone)
+    else:
+        fixed = None
+
+    instants = []
+    offsets = []
+    for value in chain(head, strings):
+        if read_epoch:
+            instant = epoch_microseconds(value, read_epoch, offset, end)
+            if instant is not None and _MIN_INSTANT <= instant <= _MAX_INSTANT:
+                instants.append(instant)
+                offsets.append(0)
+                continue
+
+        fields = read_fields(value, offset, end) if read_fields else None
+        if fields is not None:
+            utcoffset = fixed if timezone or fields[7] is None else fields[7]
+            if utcoffset is not None:
+                instant = _instant(fields, utcoffset)
+                if instant is not None:
+                    instants.append(instant)
+                    offsets.append(utcoffset)
+                    continue
+
+        try:
+            text = _decode(value, offset, end)
+            dt = matcher(text) if matcher else None
+            if dt is None:
+                dt = _parse_datetime(
+                    text, None, isofirst, dayfirst, yearfirst, epoch_unit
+                )
+            reading, utcoffset = _reading_and_offset(dt, timezone, assume_timezone)
+        except (ValueError, OverflowError, TypeError):
+            if errors == "raise":
+                raise
+            instants.append(_NAT)
+            offsets.append(0)
+            continue
+        instants.append((reading - utcoffset - _EPOCH) // _MICROSECOND)
+        offsets.append(utcoffset // _SECOND)
+
+    return ParsedArray(
+        numpy.array(instants, dtype=numpy.int64).view("datetime64[us]"),
+        numpy.array(offsets, dtype=numpy.int32),
+    )
+
+
+def _read_in_place(value, format, epoch_unit, offset, end):
+    """
+    Return the datetime the built-in readers find in ``value`` between
+    ``offset`` and ``end`` without decoding it, or ``None``: an epoch number
+    if ``epoch_unit`` is given, or an RFC 3339 timestamp if ``format`` is
+    ``"iso"``.
+    """
+    if epoch_unit:
+        dt = parse_epoch(value, epoch_unit, offset, end)
+        if dt is not None:
+            return dt
+    if format == "iso":
+        return parse_iso(value, offset, end)
+    return None
+
+
+def _numpy(caller):
+    """
+    Import NumPy, which only the array-returning functions need.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"{caller} requires NumPy; install it with pip install 'delorean[numpy]'"
+        ) from None
+    return numpy
+
+
+def _is_fixed(tz):
+    return tz is utc or isinstance(tz, fixed_offset)
+
+
+def _fixed_seconds(tz):
+    """
+    Return the offset of a fixed-offset zone in seconds, or ``None`` for a
+    zone whose offset varies.
+    """
+    if not _is_fixed(tz):
+        return None
+    return tz.utcoffset(None) // _SECOND
+
+
+def _instant(fields, offset):
+    """
+    Return microseconds since the epoch for `iso_fields` output read at a
+    UTC offset of ``offset`` seconds, or ``None`` for an impossible date.
+    """
+    year, month, day, hour, minute, second, microsecond = fields[:7]
+    try:
+        days = date(year, month, day).toordinal() - _EPOCH_ORDINAL
+    except ValueError:
+        return None
+    seconds = days * 86400 + hour * 3600 + minute * 60 + second - offset
+    return seconds * 1000000 + microsecond
+
+
+def _reading_and_offset(dt, timezone, assume_timezone):
+    """
+    Return the naive clock reading and UTC offset of the `Delorean` that
+    `_as_delorean` would build from ``dt``, without building it.
+    """
+    if timezone:
+        reading = dt.replace(tzinfo=None)
+        return reading, localize(reading, timezone).utcoffset()
+    if dt.tzinfo is None:
+        if assume_timezone is None:
+            raise DeloreanInvalidDatetime(
+                "datetime string has no timezone and assume_timezone is None"
+            )
+        return dt, localize(dt, assume_timezone).utcoffset()
+    if isinstance(dt.tzinfo, tzlocal):
+        reading = dt.replace(tzinfo=None)
+        return reading, localize(reading, get_localzone()).utcoffset()
+    return dt.replace(tzinfo=None), dt.utcoffset()
+
+
+def parse_file(
+    path,
+    column=None,
+    timezone=None,
+    isofirst=True,
+    dayfirst=True,
+    yearfirst=True,
+    *,
+    assume_timezone="UTC",
+    formats=None,
+    epoch_unit=None,
+    header=False,
+    delimiter=",",
+    encoding="utf-8",
+    workers=None,
+    chunk_size=None,
+    stream=False,
+    errors="raise",
+):
+    """
+    Parse every timestamp in a text file, spreading the work over a pool of
+    processes.
+
+    The file is memory-mapped and split into chunks on line boundaries, and
+    each worker parses its chunks with the same logic as `parse_array` or
+    `parse_many`. Results come back in file order. Blank lines are ignored.
+
+    :param path: A file of one record per line.
+    :param column: Where each line's timestamp is. ``None`` takes the whole
+        line. An integer selects a zero-based field of a delimited (CSV)
+        line. A string names a key when the lines are JSON objects, or else a
+        column in the delimited file's header row. JSON numbers are read as
+        the text they are written as, for ``epoch_unit``.
+    :param header: Whether a delimited file's first line is a header to skip.
+        It is implied when ``column`` is a name.
+    :param delimiter: The field separator of a delimited file.
+    :param encoding: The file's text encoding.
+    :param workers: How many processes to use; defaults to the CPU count.
+        ``1`` parses in this process without starting a pool.
+    :param chunk_size: Roughly how many bytes each task covers. The default
+        gives every worker a few chunks to balance the load.
+    :param stream: Return a generator of `Delorean` objects instead of a
+        `ParsedArray`. Chunks are still parsed in parallel, and each is
+        yielded as soon as it and every chunk before it are done.
+    :param errors: ``"raise"`` to stop at the first value that cannot be
+        parsed, or ``"coerce"`` to store ``NaT`` for it, or yield ``None``
+        when streaming.
+    :raises ImportError: If NumPy is not installed and ``stream`` is false.
+
+    The remaining arguments mean the same as for `parse`.
+
+    .. versionadded:: 2.1.0
+    """
+    numpy = None if stream else _numpy("parse_file")
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+    workers = workers or os.cpu_count() or 1
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start, column = _resolve_column(mm, column, header, delimiter, encoding)
+                chunk_size = chunk_size or max(size // (workers * 4), 1 << 20)
+                chunks = _chunk_bounds(mm, start, size, chunk_size)
+        else:
+            chunks = []
+
+    task = partial(
+        _parse_chunk,
+        path,
+        column=column,
+        delimiter=delimiter,
+        encoding=encoding,
+        stream=stream,
+        errors=errors,
+        options={
+            "timezone": timezone,
+            "isofirst": isofirst,
+            "dayfirst": dayfirst,
+            "yearfirst": yearfirst,
+            "assume_timezone": assume_timezone,
+            "formats": formats,
+            "epoch_unit": epoch_unit,
+        },
+    )
+
+    # workers that are spawned rather than forked need this process's
+    # timezone settings passed on
+    settings = _settings()
+    if stream:
+        return _stream_chunks(task, chunks, workers, settings)
+
+    parts = list(_run_chunks(task, chunks, workers, settings))
+    if not parts:
+        parts = [parse_array([])]
+    return ParsedArray(
+        numpy.concatenate([part.instants for part in parts]),
+        numpy.concatenate([part.offsets for part in parts]),
+    )
+
+
+def _resolve_column(mm, column, header, delimiter, encoding):
+    """
+    Return the offset the data starts at and the column to read, turning a
+    header name into an index for a delimited file.
+    """
+    first_end = mm.find(b"\n")
+    first_end = len(mm) if first_end == -1 else first_end + 1
+    first_line = mm[:first_end].decode(encoding)
+
+    if isinstance(column, str) and not first_line.lstrip().startswith("{"):
+        names = next(csv.reader([first_line], delimiter=delimiter))
+        try:
+            return first_end, names.index(column)
+        except ValueError:
+            raise ValueError(f"no column named {column!r} in the header") from None
+    if header:
+        return first_end, column
+    return 0, column
+
+
+def _chunk_bounds(mm, start, size, chunk_size):
+    """
+    Split ``mm[start:size]`` into ``(start, end)`` ranges of about
+    ``chunk_size`` bytes, each ending just after a newline or at the end.
+    """
+    bounds = []
+    while start < size:
+        end = start + chunk_size
+        if end >= size:
+            end = size
+        else:
+            newline = mm.find(b"\n", end - 1)
+            end = size if newline == -1 else newline + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _run_chunks(task, chunks, workers, settings):
+    if workers == 1 or len(chunks) < 2:
+        yield from map(task, chunks)
+        return
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_apply_settings,
+        initargs=(settings,),
+    ) as pool:
+        yield from pool.map(task, chunks)
+
+
+def _stream_chunks(task, chunks, workers, settings):
+    for results in _run_chunks(task, chunks, workers, settings):
+        yield from results
+
+
+def _parse_chunk(path, bounds, *, column, delimiter, encoding, stream, errors, options):
+    """
+    Parse the timestamps in one chunk of a file; this runs in the workers.
+    """
+    start, end = bounds
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = mm[start:end].decode(encoding).splitlines()
+    lines = [line for line in lines if line.strip()]
+
+    if column is None:
+        values = [line.strip() for line in lines]
+    elif isinstance(column, str):
+        # numbers are kept as the text they are written as, so epochs read
+        # exactly, as they do from a delimited file
+        values = [
+            json.loads(line, parse_int=str, parse_float=str).get(column)
+            for line in lines
+        ]
+    else:
+        values = [
+            row[column] if len(row) > column else None
+            for row in csv.reader(lines, delimiter=delimiter)
+        ]
+
+    if not stream:
+        return parse_array(values, errors=errors, **options)
+    if errors == "raise":
+        return list(parse_many(values, errors="raise", **options))
+
+    results = parse_many(values, errors="collect", **options)
+    parsed = list(results)
+    for index, _ in results.errors:
+        parsed.insert(index, None)
+    return parsed
+
+
+ParseCacheInfo = namedtuple(
+    "ParseCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class ParseCache(object):
+    """
+    A bounded, least-recently-used memo in front of `parse`.
+
+    Logs and metrics repeat the same timestamp string many times over, and
+    each repeat costs a full parse. A `ParseCache` remembers the result for
+    the ``maxsize`` most recently used combinations of string and `parse`
+    arguments and evicts the least recently used one beyond that. Calls made
+    after `~delorean.timezones.set_abbreviation_regions`,
+    `~delorean.timezones.use_snapshot` or a change of local timezone do not
+    reuse results from before it.
+
+    Every call returns a new `Delorean`, so mutating a result with
+    :meth:`~Delorean.shift` or :meth:`~Delorean.truncate` cannot change what a
+    later call returns. Strings that fail to parse are not cached.
+
+    .. versionadded:: 2.1.0
+
+    .. testsetup::
+
+        from delorean import ParseCache
+
+    .. doctest::
+
+        >>> cache = ParseCache(maxsize=1024)
+        >>> cache.parse('2015-01-01 00:01:02 -0800')
+        Delorean(datetime=datetime.datetime(2015, 1, 1, 0, 1, 2), timezone='UTC-08:00')
+        >>> cache.parse('2015-01-01 00:01:02 -0800').shift('UTC')
+        Delorean(datetime=datetime.datetime(2015, 1, 1, 8, 1, 2), timezone='UTC')
+        >>> cache.parse('2015-01-01 00:01:02 -0800')
+        Delorean(datetime=datetime.datetime(2015, 1, 1, 0, 1, 2), timezone='UTC-08:00')
+        >>> cache.info()
+        ParseCacheInfo(hits=2, misses=1, evictions=0, maxsize=1024, currsize=1)
+
+    """
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def parse(
+        self,
+        datetime_str,
+        timezone=None,
+        isofirst=True,
+        dayfirst=True,
+        yearfirst=True,
+        *,
+        assume_timezone="UTC",
+        formats=None,
+        epoch_unit=None,
+        offset=0,
+        length=None,
+    ):
+        """
+        Return what `parse` returns for the same arguments, reusing an
+        earlier result when there is one.
+        """
+        if isinstance(formats, list):
+            formats = tuple(formats)
+        text, start, size = datetime_str, offset, length
+        if isinstance(datetime_str, (bytes, bytearray, memoryview)):
+            # mutable buffers are unhashable, or refuse to hash when writable,
+            # so binary input is remembered by the bytes it holds at the time
+            # of the call
+            end = None if length is None else offset + length
+            text, start, size = bytes(memoryview(datetime_str)[offset:end]), 0, None
+        key = (
+            text,
+            timezone,
+            isofirst,
+            dayfirst,
+            yearfirst,
+            assume_timezone,
+            formats,
+            epoch_unit,
+            start,
+            size,
+            # what abbreviations and local names resolve to can change
+            _settings(),
+            time.tzname,
+        )
+        try:
+            with self._lock:
+                dt, local = self._entries[key]
+                if local is not None and local is not get_localzone():
+                    # read in the local timezone, which has changed since
+                    raise KeyError(key)
+                self._entries.move_to_end(key)
+                self._hits += 1
+        except KeyError:
+            pass
+        except (TypeError, ValueError):
+            # an unhashable argument, such as a mutable tzinfo; nothing to
+            # remember it by, so parse without the cache
+            return parse(
+                datetime_str,
+                timezone,
+                isofirst,
+                dayfirst,
+                yearfirst,
+                assume_timezone=assume_timezone,
+                formats=formats,
+                epoch_unit=epoch_unit,
+                offset=offset,
+                length=length,
+            )
+        else:
+            # the stored datetime is immutable, so a fresh wrapper is all it
+            # takes to keep callers from sharing state
+            return Delorean(datetime=dt)
+
+        do = parse(
+            datetime_str,
+            timezone,
+            isofirst,
+            dayfirst,
+            yearfirst,
+            assume_timezone=assume_timezone,
+            formats=formats,
+            epoch_unit=epoch_unit,
+            offset=offset,
+            length=length,
+        )
+        # checking the local timezone costs more than the rest of a hit, so
+        # only results that may have been read in it are checked
+        local = do.datetime.tzinfo
+        if local is not get_localzone():
+            local = None
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = do.datetime, local
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return do
+
+    def info(self):
+        """
+        Return a `ParseCacheInfo` of hits, misses and evictions so far, along
+        with ``maxsize`` and the current number of entries.
+        """
+        with self._lock:
+            return ParseCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self):
+        """
+        Forget every entry and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
 def range_daily(start=None, stop=None, timezone="UTC", count=None):
     """
     This an alternative way to generating sets of Delorean objects with
@@ -0,0 +1,458 @@
+"""
+Fast paths for turning strings into datetimes.
+
+`dateutil` reads almost anything, but it pays for that generality on every
+call. The parsers here recognise the layouts that dominate real feeds and
+return ``None`` for everything else, so `delorean.parse` only takes the
+general-purpose road for unusual input.
+"""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from .timezones import offset_timezone, utc
+
+# The fixed-width RFC 3339 profile of ISO 8601: a full date, optionally a
+# ``T`` or space and a time of at least hours and minutes, then optionally a
+# fraction of a second and a ``Z`` or numeric offset. Other ISO layouts (week
+# dates, ordinal dates, the basic format without separators) are left to
+# `dateutil.parser.isoparse`.
+_ISO = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?"
+    r"(?:([Zz])|([+-])(\d{2})(?::?(\d{2}))?)?)?",
+    re.ASCII,
+)
+_ISO_BYTES = re.compile(_ISO.pattern.encode(), re.ASCII)
+
+# The binary types the fast readers accept alongside `str`. Groups matched in
+# them come out as `bytes`, which `int` reads as readily as text.
+_BUFFERS = (bytes, bytearray, memoryview)
+_MINUS = ("-", b"-")
+
+
+def _fullmatch(pattern, bytes_pattern, text, pos, endpos):
+    """
+    Match the part of ``text`` from ``pos`` to ``endpos`` with whichever of
+    the two patterns suits its type, or return ``None`` for other types.
+    """
+    if isinstance(text, _BUFFERS):
+        pattern = bytes_pattern
+    elif not isinstance(text, str):
+        return None
+    return pattern.fullmatch(text, pos, len(text) if endpos is None else endpos)
+
+
+# What `isoparse` needs to get past the year. It reads the first four
+# characters with `int`, which also tolerates surrounding whitespace, a sign
+# and digit-separating underscores, and the character after them must start a
+# month, week or ordinal day.
+_ISO_YEAR = re.compile(r"\s*[+-]?[0-9](?:_?[0-9])*\s*", re.ASCII)
+_ISO_AFTER_YEAR = frozenset("0123456789+-W \t\n\r\x0b\x0c")
+
+
+def classify(text):
+    """
+    Return which parser should read ``text``, judged from its first few
+    characters without trying any of them.
+
+    ``"rfc3339"`` means `parse_iso` is likely to succeed. ``"iso"`` means the
+    string might be some other ISO 8601 layout for `isoparse`. ``"generic"``
+    means `isoparse` is certain to reject it, so it can go straight to
+    `dateutil.parser.parse` without raising and catching an error first.
+    Anything other than a string is classified ``"iso"``, since `isoparse`
+    also accepts bytes.
+    """
+    if not isinstance(text, str):
+        return "iso"
+    if len(text) < 4 or not text.isascii() or not _ISO_YEAR.fullmatch(text, 0, 4):
+        return "generic"
+    if len(text) == 4:
+        return "iso"
+    if text[4] == "-" and text[7:8] == "-" and len(text) >= 10:
+        return "rfc3339"
+    if text[4] not in _ISO_AFTER_YEAR:
+        return "generic"
+    return "iso"
+
+
+def iso_fields(text, pos=0, endpos=None):
+    """
+    Return the fields of an RFC 3339 style string without building a
+    datetime, or ``None`` if `parse_iso` would not handle it.
+
+    ``text`` may also be `bytes`, `bytearray` or `memoryview`, and ``pos``
+    and ``endpos`` limit the match to part of it, as they do for a compiled
+    regular expression, so a timestamp embedded in a larger buffer is read
+    in place.
+
+    The result is ``(year, month, day, hour, minute, second, microsecond,
+    offset)``, where ``offset`` is the UTC offset in whole seconds, ``0`` for
+    ``Z``, or ``None`` if the string has none. The time fields are range
+    checked but the date is not, so a caller still has to reject dates such
+    as 30 February.
+    """
+    match = _fullmatch(_ISO, _ISO_BYTES, text, pos, endpos)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction = match.group(1, 2, 3, 4, 5, 6, 7)
+    zulu, sign, off_hours, off_minutes = match.group(8, 9, 10, 11)
+
+    hour = int(hour or 0)
+    minute = int(minute or 0)
+    second = int(second or 0)
+    if hour > 23 or minute > 59 or second > 59:
+        # 24:00 and leap seconds are for isoparse to accept or reject
+        return None
+
+    if zulu:
+        offset = 0
+    elif sign:
+        hours = int(off_hours)
+        minutes = int(off_minutes or 0)
+        if hours > 23 or minutes > 59:
+            return None
+        offset = (hours * 60 + minutes) * 60
+        if sign in _MINUS:
+            offset = -offset
+    else:
+        offset = None
+
+    if fraction:
+        fraction = fraction[:6]
+        microsecond = int(fraction) * 10 ** (6 - len(fraction))
+    else:
+        microsecond = 0
+
+    return int(year), int(month), int(day), hour, minute, second, microsecond, offset
+
+
+def parse_iso(text, pos=0, endpos=None):
+    """
+    Return the datetime an RFC 3339 style string describes, or ``None``.
+
+    The result matches what `dateutil.parser.isoparse` returns for the same
+    string, except that offsets are standard library objects: ``Z`` and any
+    zero offset become `delorean.utc` and other offsets a `datetime.timezone`.
+    Fractions beyond microseconds are truncated, as `isoparse` does.
+
+    ``None`` means the string is not in a layout this parser handles, not that
+    it is invalid. That includes ``24:00`` and out-of-range fields, which are
+    left for `isoparse` to accept or reject.
+
+    See `iso_fields` for the types of ``text`` and for ``pos`` and ``endpos``.
+    """
+    fields = iso_fields(text, pos, endpos)
+    if fields is None:
+        return None
+
+    offset = fields[7]
+    if offset is None:
+        tz = None
+    elif offset == 0:
+        tz = utc
+    else:
+        tz = offset_timezone(offset)
+
+    try:
+        return datetime(*fields[:7], tzinfo=tz)
+    except ValueError:
+        return None
+
+
+_EPOCH_NUMBER = re.compile(r"(-?)([0-9]+)(?:\.([0-9]+))?", re.ASCII)
+_EPOCH_NUMBER_BYTES = re.compile(_EPOCH_NUMBER.pattern.encode(), re.ASCII)
+
+# Decimal places each unit holds below a second.
+EPOCH_UNITS = {"s": 0, "ms": 3, "us": 6, "ns": 9}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=utc)
+
+
+def epoch_microseconds(text, unit="s", pos=0, endpos=None):
+    """
+    Return the whole microseconds since the Unix epoch that a numeric string
+    counts, or ``None`` if ``text`` is not a plain decimal number.
+
+    :param unit: What ``text`` counts: ``"s"``, ``"ms"``, ``"us"`` or
+        ``"ns"``, or ``"auto"`` to judge from the number of digits before any
+        decimal point: up to 11 for seconds, 14 for milliseconds, 17 for
+        microseconds and more for nanoseconds.
+
+    The arithmetic is exact, so values are never disturbed by floating point.
+    Digits finer than a microsecond are rounded half to even, as
+    `datetime.fromtimestamp` rounds.
+
+    See `iso_fields` for the types of ``text`` and for ``pos`` and ``endpos``.
+
+    :raises ValueError: If ``unit`` is not one of the above.
+    """
+    if unit != "auto" and unit not in EPOCH_UNITS:
+        raise ValueError(f"unknown epoch unit {unit!r}")
+    match = _fullmatch(_EPOCH_NUMBER, _EPOCH_NUMBER_BYTES, text, pos, endpos)
+    if match is None:
+        return None
+    sign, whole, fraction = match.groups()
+    # an empty fraction of the same type as the digits, str or bytes
+    fraction = fraction or whole[:0]
+
+    if unit == "auto":
+        digits = len(str(int(whole)))
+        if digits <= 11:
+            unit = "s"
+        elif digits <= 14:
+            unit = "ms"
+        elif digits <= 17:
+            unit = "us"
+        else:
+            unit = "ns"
+    exponent = 6 - EPOCH_UNITS[unit] - len(fraction)
+    value = int(whole + fraction)
+    if exponent >= 0:
+        value *= 10**exponent
+    else:
+        divisor = 10**-exponent
+        value, remainder = divmod(value, divisor)
+        if remainder * 2 > divisor or (remainder * 2 == divisor and value % 2):
+            value += 1
+    return -value if sign else value
+
+
+def parse_epoch(text, unit="s", pos=0, endpos=None):
+    """
+    Return the UTC datetime a numeric epoch string describes, or ``None`` if
+    ``text`` is not a plain decimal number.
+
+    See `epoch_microseconds` for the arguments.
+
+    :raises ValueError: If ``unit`` is not one of the above.
+    :raises OverflowError: If the value is outside the range of `datetime`.
+    """
+    microseconds = epoch_microseconds(text, unit, pos, endpos)
+    if microseconds is None:
+        return None
+    return _EPOCH + timedelta(microseconds=microseconds)
+
+
+# Layouts worth trying when nobody has said which one a feed uses, most
+# specific first. The RFC 3339 layout `parse_iso` reads comes before all of
+# these.
+COMMON_FORMATS = (
+    "%Y-%m-%d %H:%M:%S %z",
+    "%Y/%m/%d %H:%M:%S %z",
+    "%Y/%m/%d %H:%M:%S",
+    "%d/%b/%Y:%H:%M:%S %z",
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%a %b %d %H:%M:%S %Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y%m%d%H%M%S",
+)
+
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_WEEKDAY_NAMES = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+_MONTHS = {
+    name: number
+    for number, month in enumerate(_MONTH_NAMES, start=1)
+    for name in (month, month[:3])
+}
+
+# The same patterns `datetime.strptime` builds for each directive, minus the
+# locale lookups: month and weekday names are always read in English.
+_DIRECTIVES = {
+    "Y": r"(?P<Y>\d{4})",
+    "y": r"(?P<y>\d{2})",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "j": r"(?P<j>36[0-6]|3[0-5]\d|[12]\d\d|0[1-9]\d|00[1-9]|[1-9]\d|0[1-9]|[1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "I": r"(?P<I>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "f": r"(?P<f>\d{1,6})",
+    "p": r"(?P<p>am|pm)",
+    "b": "(?P<b>%s)" % "|".join(name[:3] for name in _MONTH_NAMES),
+    "B": "(?P<B>%s)" % "|".join(_MONTH_NAMES),
+    "a": "(?:%s)" % "|".join(name[:3] for name in _WEEKDAY_NAMES),
+    "A": "(?:%s)" % "|".join(_WEEKDAY_NAMES),
+    "z": r"(?P<z>(?-i:Z)|[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?)",
+    "%": "%",
+}
+
+
+class CompiledFormat(object):
+    """
+    A `strptime` format turned into a reusable matcher.
+
+    Build these with `compile_format`, which caches them. `match` returns the
+    datetime a string describes, or ``None`` if the string does not follow
+    the format, so trying several formats in turn never raises.
+    """
+
+    __slots__ = ("format", "_match", "_fields")
+
+    def __init__(self, format):
+        self.format = format
+        pattern = []
+        fields = []
+        chars = iter(format)
+        for char in chars:
+            if char == "%":
+                directive = next(chars, "")
+                try:
+                    pattern.append(_DIRECTIVES[directive])
+                except KeyError:
+                    raise ValueError(
+                        f"unsupported directive %{directive} in {format!r}"
+                    ) from None
+                if directive not in "aA%":
+                    fields.append(directive)
+            elif char.isspace():
+                # strptime lets any run of whitespace stand in for a space
+                if pattern[-1:] != [r"\s+"]:
+                    pattern.append(r"\s+")
+            else:
+                pattern.append(re.escape(char))
+
+        try:
+            regex = re.compile("".join(pattern), re.IGNORECASE | re.ASCII)
+        except re.error as e:
+            # most likely a directive used twice, which strptime rejects too
+            raise ValueError(f"invalid format {format!r}: {e}") from None
+        self._match = regex.fullmatch
+        self._fields = frozenset(fields)
+
+    def __repr__(self):
+        return "CompiledFormat(%r)" % self.format
+
+    def match(self, text):
+        """
+        Return the datetime ``text`` describes, or ``None`` if it does not
+        follow this format or names an impossible date.
+
+        Fields the format leaves out default as they do for
+        `datetime.strptime`. A ``%z`` of zero becomes `delorean.utc`.
+        """
+        match = self._match(text)
+        if match is None:
+            return None
+        fields = self._fields
+        values = match.groupdict()
+
+        if "Y" in fields:
+            year = int(values["Y"])
+        elif "y" in fields:
+            year = int(values["y"])
+            year += 2000 if year < 69 else 1900
+        else:
+            year = 1900
+
+        if "m" in fields:
+            month = int(values["m"])
+        elif "b" in fields:
+            month = _MONTHS[values["b"].lower()]
+        elif "B" in fields:
+            month = _MONTHS[values["B"].lower()]
+        else:
+            month = 1
+
+        day = int(values["d"]) if "d" in fields else 1
+
+        if "H" in fields:
+            hour = int(values["H"])
+        elif "I" in fields:
+            hour = int(values["I"]) % 12
+            if "p" in fields and values["p"].lower() == "pm":
+                hour += 12
+        else:
+            hour = 0
+
+        minute = int(values["M"]) if "M" in fields else 0
+        second = int(values["S"]) if "S" in fields else 0
+        microsecond = int(values["f"].ljust(6, "0")) if "f" in fields else 0
+        tz = _offset(values["z"]) if "z" in fields else None
+
+        try:
+            if "j" in fields and not fields & {"m", "b", "B", "d"}:
+                start = datetime(year, 1, 1, hour, minute, second, microsecond, tz)
+                return start + timedelta(days=int(values["j"]) - 1)
+            return datetime(year, month, day, hour, minute, second, microsecond, tz)
+        except ValueError:
+            return None
+
+
+def _offset(text):
+    """
+    Return the tzinfo for a ``%z`` value, with zero as `delorean.utc`.
+    """
+    if text == "Z":
+        return utc
+    digits = text[1:].replace(":", "")
+    fraction = "0"
+    if "." in digits:
+        digits, fraction = digits.split(".")
+    offset = timedelta(
+        hours=int(digits[0:2]),
+        minutes=int(digits[2:4]),
+        seconds=int(digits[4:6] or 0),
+        microseconds=int(fraction.ljust(6, "0")),
+    )
+    if not offset:
+        return utc
+    return offset_timezone(-offset if text[0] == "-" else offset)
+
+
+@lru_cache(maxsize=256)
+def compile_format(format):
+    """
+    Return the `CompiledFormat` for a `strptime` format string.
+
+    Compiled formats are kept in a bounded cache, so a program reading the
+    same few layouts over and over compiles each of them once.
+
+    :raises ValueError: If the format uses a directive other than
+        ``%Y %y %m %d %j %H %I %M %S %f %p %b %B %a %A %z`` or ``%%``.
+    """
+    return CompiledFormat(format)
+
+
+def parse_formats(text, formats):
+    """
+    Return the datetime from the first of ``formats`` that ``text`` follows,
+    or ``None`` if it follows none of them.
+
+    :param formats: A `strptime` format string, or a sequence of them to try
+        in order.
+    """
+    if isinstance(formats, str):
+        formats = (formats,)
+    for format in formats:
+        dt = compile_format(format).match(text)
+        if dt is not None:
+            return dt
+    return None
@@ -7,13 +7,22 @@ offset. `timezone` is the only constructor a caller needs, so working with
 `Delorean` objects never means importing a timezone library of your own.
 """
 
+import io
+import os
 import re
-from datetime import timedelta, tzinfo
+import time
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import datetime, timedelta, tzinfo
 from datetime import timezone as fixed_offset
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from functools import lru_cache
+from itertools import groupby
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
 
 from dateutil.tz import tzoffset
+from tzlocal import reload_localzone
 
+from . import tzif
 from .exceptions import DeloreanInvalidTimezone
 
 utc = ZoneInfo("UTC")
@@ -23,14 +32,47 @@ utc = ZoneInfo("UTC")
 # `timezone()`.
 _OFFSET = re.compile(r"^UTC([+-])(\d{2}):(\d{2})(?::(\d{2}))?$")
 
+# What `timezone` has resolved each name to, and the one `datetime.timezone`
+# handed out for each offset. Both only ever grow by valid input, and there
+# is a bounded number of zone names and whole-second offsets in use.
+_names = {"UTC": utc}
+_offsets = {}
 
-def timezone(name):
+
+def offset_timezone(offset):
+    """
+    Return the fixed-offset timezone for ``offset``, a `timedelta` or a
+    number of seconds.
+
+    Every call with the same offset returns the same `datetime.timezone`
+    object, so parsed rows with equal offsets share one tzinfo rather than
+    each allocating their own.
+
+    .. versionadded:: 2.1.0
+    """
+    try:
+        return _offsets[offset]
+    except KeyError:
+        pass
+    delta = offset if isinstance(offset, timedelta) else timedelta(seconds=offset)
+    tz = _offsets.get(delta)
+    if tz is None:
+        tz = _offsets[delta] = fixed_offset(delta)
+    _offsets[offset] = tz
+    return tz
+
+
+def timezone(name, canonical=False):
     """
     Return the timezone that `name` identifies.
 
     :param name: An IANA zone name such as ``"US/Eastern"``, a fixed offset
         written as ``"UTC-08:00"``, or a `tzinfo` object, which is returned
         unchanged so this can normalize whatever a caller supplies.
+    :param canonical: Return the zone under its canonical name, as
+        `canonical_name` gives it, so every alias of a zone yields the one
+        object. By default the zone keeps the name it was asked for, and
+        with it its ``repr``.
     :raises DeloreanInvalidTimezone: If the name identifies no known zone.
 
     .. testsetup::
@@ -46,24 +88,676 @@ def timezone(name):
 
     .. versionadded:: 2.0
 
+    .. versionchanged:: 2.1.0
+        Names are resolved once and remembered, and every fixed offset comes
+        from `offset_timezone`, so equal inputs give the identical object.
+        Call ``timezone.cache_clear()`` after the tz database changes.
+        Added ``canonical``.
+
     """
+    if isinstance(name, str):
+        if canonical:
+            name = canonical_name(name)
+        try:
+            return _names[name]
+        except KeyError:
+            tz = _names[name] = _resolve(name)
+            return tz
+
     if isinstance(name, tzoffset):
         # dateutil's offsets reach here from parsed strings; convert them so
         # every fixed offset delorean stores is the same type.
-        return fixed_offset(name.utcoffset(None))
+        return offset_timezone(name.utcoffset(None))
 
     if isinstance(name, tzinfo):
+        if canonical and isinstance(name, ZoneInfo) and name.key:
+            key = canonical_name(name.key)
+            if key != name.key:
+                return timezone(key)
         return name
 
+    return _resolve(name)
+
+
+_canonical = None
+
+
+def canonical_name(name):
+    """
+    Return the canonical name of the zone called ``name``.
+
+    The tz database keeps many zones under older or regional names as links
+    to one canonical zone, such as ``"US/Pacific"`` for
+    ``"America/Los_Angeles"``. Those links are indexed on first use; names
+    that are not links, including ones that name no zone, are returned
+    unchanged. Every spelling of UTC gives ``"UTC"``, the name of `utc`.
+
+    .. testsetup::
+
+        from delorean.timezones import canonical_name
+
+    .. doctest::
+
+        >>> canonical_name('US/Pacific')
+        'America/Los_Angeles'
+        >>> canonical_name('Etc/Zulu')
+        'UTC'
+
+    .. versionadded:: 2.1.0
+    """
+    global _canonical
+    if _canonical is None:
+        _canonical = {
+            alias: "UTC" if target == "Etc/UTC" else target
+            for alias, target in tzif.links().items()
+        }
+        _canonical["Etc/UTC"] = "UTC"
+        _canonical.pop("UTC", None)
+    return _canonical.get(name, name)
+
+
+# How often, in seconds, `local_timezone` looks at /etc/localtime for changes.
+LOCAL_CHECK_INTERVAL = 60.0
+
+_LOCALTIME = "/etc/localtime"
+
+# ``(zone, TZ variable, /etc/localtime mtime, when last checked)``
+_local = None
+
+
+def local_timezone():
+    """
+    Return this machine's timezone, remembered between calls.
+
+    A change to the ``TZ`` environment variable is noticed on the next call.
+    The modification time of ``/etc/localtime`` is checked at most every
+    `LOCAL_CHECK_INTERVAL` seconds, so frequent callers such as
+    `delorean.now` do not touch the filesystem each time. Call
+    `refresh_local_timezone` to pick up a change immediately.
+
+    .. versionadded:: 2.1.0
+    """
+    state = _local
+    env = os.environ.get("TZ")
+    if state is not None and state[1] == env:
+        now = time.monotonic()
+        if now - state[3] < LOCAL_CHECK_INTERVAL:
+            return state[0]
+        if _localtime_mtime() == state[2]:
+            _remember_local(state[0], env, state[2], now)
+            return state[0]
+    return refresh_local_timezone()
+
+
+def refresh_local_timezone():
+    """
+    Look up this machine's timezone again, remember it for `local_timezone`
+    and return it.
+
+    .. versionadded:: 2.1.0
+    """
+    env = os.environ.get("TZ")
+    mtime = _localtime_mtime()
+    tz = reload_localzone()
+    _remember_local(tz, env, mtime, time.monotonic())
+    return tz
+
+
+def _remember_local(tz, env, mtime, checked):
+    global _local
+    _local = (tz, env, mtime, checked)
+
+
+def _localtime_mtime():
+    try:
+        return os.stat(_LOCALTIME).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _resolve(name):
     match = _OFFSET.match(name) if isinstance(name, str) else None
     if match:
         sign, hours, minutes, seconds = match.groups()
         offset = timedelta(
             hours=int(hours), minutes=int(minutes), seconds=int(seconds or 0)
         )
-        return fixed_offset(-offset if sign == "-" else offset)
+        return offset_timezone(-offset if sign == "-" else offset)
 
     try:
+        if _snapshot is not None and name in _snapshot:
+            return _SnapshotZone.from_file(io.BytesIO(_snapshot[name]), key=name)
         return ZoneInfo(name)
     except (ZoneInfoNotFoundError, ValueError, TypeError):
         raise DeloreanInvalidTimezone(f"Unknown timezone: {name!r}") from None
+
+
+class _SnapshotZone(ZoneInfo):
+    """
+    A zone read from a snapshot. `zoneinfo` cannot pickle zones read from a
+    file, so this one pickles by name and is looked up again with `timezone`
+    when loaded, from a snapshot or the tz database, whichever is in use.
+    """
+
+    def __repr__(self):
+        return "zoneinfo.ZoneInfo(key=%r)" % self.key
+
+    def __reduce__(self):
+        return timezone, (self.key,)
+
+
+def _cache_clear():
+    """
+    Forget every resolved name, and `zoneinfo`'s own cache of zones with it,
+    so the next lookups read the tz database afresh. `utc` stays what
+    ``"UTC"`` resolves to, since delorean compares against it by identity.
+    """
+    global _canonical, _offset_index
+    _names.clear()
+    _names["UTC"] = utc
+    _tables.clear()
+    _canonical = None
+    _offset_index = None
+    ZoneInfo.clear_cache()
+
+
+timezone.cache_clear = _cache_clear
+
+
+_snapshot = None
+
+
+def use_snapshot(path):
+    """
+    Load zones from the snapshot file at ``path`` from now on, or stop when
+    ``path`` is ``None``.
+
+    A snapshot, written by ``python -m delorean.tzif``, holds many zones in
+    one file that is mapped into memory rather than read, so looking up a
+    zone does not search the filesystem, and processes using the same
+    snapshot share its pages. Names the snapshot lacks are still looked up
+    in the tz database. Zones loaded so far are forgotten, as by
+    ``timezone.cache_clear()``.
+
+    Zones loaded from a snapshot are distinct objects from those
+    `zoneinfo.ZoneInfo` returns for the same name. They pickle by name, so
+    they load as whatever zone that name resolves to where they are
+    unpickled.
+
+    :raises ValueError: If ``path`` is not a snapshot file.
+
+    .. versionadded:: 2.1.0
+    """
+    global _snapshot
+    snapshot = tzif.Snapshot(path) if path is not None else None
+    if _snapshot is not None:
+        _snapshot.close()
+    _snapshot = snapshot
+    _cache_clear()
+
+
+def _settings():
+    """
+    Return what another process needs, through `_apply_settings`, to resolve
+    zones and abbreviations as this one does. Processes that are spawned
+    rather than forked start from the defaults.
+    """
+    path = _snapshot.path if _snapshot is not None else None
+    return _abbreviation_regions, path
+
+
+def _apply_settings(settings):
+    regions, path = settings
+    set_abbreviation_regions(*regions)
+    # a forked process already has these, along with any preloaded zones
+    # that switching snapshots would throw away
+    if path != (_snapshot.path if _snapshot is not None else None):
+        use_snapshot(path)
+
+
+# UTC offsets, in minutes, of the zone abbreviations strings commonly carry,
+# grouped by where they are used. Some abbreviations mean different things in
+# different regions; `set_abbreviation_regions` decides which region wins.
+# UTC and GMT are left out because `dateutil` already knows them.
+ABBREVIATION_REGIONS = {
+    "north_america": {
+        "NST": -210,
+        "NDT": -150,
+        "AST": -240,
+        "ADT": -180,
+        "EST": -300,
+        "EDT": -240,
+        "CST": -360,
+        "CDT": -300,
+        "MST": -420,
+        "MDT": -360,
+        "PST": -480,
+        "PDT": -420,
+        "AKST": -540,
+        "AKDT": -480,
+        "HST": -600,
+    },
+    "europe": {
+        "WET": 0,
+        "WEST": 60,
+        "BST": 60,
+        "CET": 60,
+        "CEST": 120,
+        "EET": 120,
+        "EEST": 180,
+        "MSK": 180,
+    },
+    "asia": {
+        "AST": 180,
+        "PKT": 300,
+        "IST": 330,
+        "ICT": 420,
+        "WIB": 420,
+        "CST": 480,
+        "HKT": 480,
+        "SGT": 480,
+        "PHT": 480,
+        "KST": 540,
+        "JST": 540,
+    },
+    "australia": {
+        "AWST": 480,
+        "ACST": 570,
+        "ACDT": 630,
+        "AEST": 600,
+        "AEDT": 660,
+        "NZST": 720,
+        "NZDT": 780,
+    },
+}
+
+_abbreviation_regions = ("north_america", "europe", "asia", "australia")
+
+
+def set_abbreviation_regions(*regions):
+    """
+    Choose which regions' abbreviations `delorean.parse` understands, and
+    which meaning wins when regions disagree.
+
+    :param regions: Keys of `ABBREVIATION_REGIONS`, most preferred first.
+        The default order reads ``"CST"`` as US Central time; put ``"asia"``
+        first to read it as China Standard Time instead. Regions left out
+        are not consulted at all.
+    :raises ValueError: If a region is unknown.
+
+    .. versionadded:: 2.1.0
+    """
+    global _abbreviation_regions
+    unknown = [region for region in regions if region not in ABBREVIATION_REGIONS]
+    if unknown:
+        raise ValueError(f"Unknown abbreviation regions: {unknown!r}")
+    _abbreviation_regions = regions
+
+
+def abbreviations():
+    """
+    Return the table of zone abbreviations `delorean.parse` uses, mapping
+    each abbreviation to a fixed-offset `datetime.timezone`.
+
+    Abbreviations in `time.tzname` are left out, so strings carrying this
+    machine's own abbreviations keep resolving to the local zone as they
+    always have. The table is built once for each combination of regions
+    and local zone, so the result must not be modified.
+
+    .. versionadded:: 2.1.0
+    """
+    return _abbreviations(_abbreviation_regions, tuple(time.tzname))
+
+
+@lru_cache(maxsize=8)
+def _abbreviations(regions, local_names):
+    offsets = {}
+    for region in reversed(regions):
+        offsets.update(ABBREVIATION_REGIONS[region])
+    for name in local_names:
+        offsets.pop(name, None)
+
+    zones = {
+        minutes: offset_timezone(minutes * 60) if minutes else utc
+        for minutes in set(offsets.values())
+    }
+    return {name: zones[minutes] for name, minutes in offsets.items()}
+
+
+def preload(names=None, tables=True):
+    """
+    Load timezones into this process ahead of their first use.
+
+    A prefork server that calls this before forking pays for reading and
+    parsing the tz database once; each worker inherits the loaded zones
+    copy-on-write instead of loading its own. Zones stay loaded until
+    ``timezone.cache_clear()``.
+
+    :param names: The zone names to load, or ``None`` for every zone in
+        `zoneinfo.available_timezones`, skipping any that fail to load.
+    :param tables: Also build each zone's `TransitionTable`, which
+        `to_local` and `delorean.localize_many` use.
+    :raises DeloreanInvalidTimezone: If one of ``names`` is unknown.
+
+    Calling `gc.freeze` after this, just before forking, keeps the garbage
+    collector from writing to the inherited objects and unsharing their
+    pages.
+
+    .. versionadded:: 2.1.0
+    """
+    strict = names is not None
+    if names is None:
+        names = sorted(available_timezones())
+    for name in names:
+        try:
+            tz = timezone(name)
+            if tables:
+                transitions(tz)
+        except DeloreanInvalidTimezone:
+            if strict:
+                raise
+
+
+TransitionTable = namedtuple("TransitionTable", ["transitions", "offsets", "until"])
+TransitionTable.__doc__ = """
+The history of a zone's UTC offset, as `transitions` returns it.
+
+``transitions`` is a sorted tuple of the UTC instants, in seconds since the
+epoch, at which the offset changes. ``offsets`` has one more entry:
+``offsets[i]`` is the offset in seconds in force before ``transitions[i]``,
+and the last entry is the one after the final transition, so
+``offsets[bisect_right(transitions, t)]`` is the offset at instant ``t``.
+``until`` is the instant from which the table no longer applies because the
+zone's daylight saving rules continue past it, or ``None`` if the last offset
+holds forever.
+"""
+
+_tables = {}
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+_WEEK = 7 * 86400
+_YEAR = 365 * 86400
+# how far ahead recurring daylight saving rules are written out
+_HORIZON = (datetime(2100, 1, 1) - _EPOCH) // _SECOND
+
+
+def transitions(tz):
+    """
+    Return the `TransitionTable` of ``tz``, anything `timezone` accepts.
+
+    The table is built once per zone from the tz database and remembered.
+    Zones whose daylight saving rules recur indefinitely have them written
+    out up to 2100.
+
+    :raises DeloreanInvalidTimezone: If ``tz`` is unknown, or is a zone with
+        no tz database entry to read, such as the local zone from `dateutil`.
+
+    .. versionadded:: 2.1.0
+    """
+    tz = timezone(tz)
+    try:
+        return _tables[tz]
+    except KeyError:
+        pass
+    except TypeError:
+        # an unhashable tzinfo, which can only fail to have a table
+        return _build_table(tz)
+
+    # aliases share the table of the zone they name
+    zone = timezone(tz, canonical=True)
+    table = _tables.get(zone)
+    if table is None:
+        table = _tables[zone] = _build_table(zone)
+    _tables[tz] = table
+    return table
+
+
+def _build_table(tz):
+    if isinstance(tz, fixed_offset):
+        return TransitionTable((), (tz.utcoffset(None) // _SECOND,), None)
+
+    data = None
+    if isinstance(tz, ZoneInfo) and tz.key:
+        if _snapshot is not None and tz.key in _snapshot:
+            data = _snapshot[tz.key]
+        else:
+            data = tzif.find(tz.key)
+    if data is None:
+        raise DeloreanInvalidTimezone(f"No transition data for {tz!r}")
+    instants, offsets, footer = tzif.read(data)
+
+    # keep only the transitions that change the offset; others just rename
+    # the local time
+    changes = [0]
+    for i in range(1, len(offsets)):
+        if offsets[i] != offsets[changes[-1]]:
+            changes.append(i)
+    transitions_ = [instants[i - 1] for i in changes[1:]]
+    offsets = [offsets[i] for i in changes]
+
+    if "," not in footer:
+        return TransitionTable(tuple(transitions_), tuple(offsets), None)
+
+    # The footer is a POSIX TZ rule with daylight saving time. Rather than
+    # interpret it separately, ask zoneinfo, which already does. Its changes
+    # recur yearly, give or take a week for rules like "second Sunday in
+    # March", so find one year's week by week and then each later one near
+    # the same change a year before.
+    start = instants[-1] if instants else 0
+    tail = []
+    previous = _offset_at(tz, start)
+    for week in range(start, start + _YEAR + _WEEK, _WEEK):
+        change = _find_change(tz, week, week + _WEEK, previous)
+        if change is not None:
+            tail.append(change)
+            previous = change[1]
+
+    for transition, offset in tail:
+        if transition >= _HORIZON:
+            break
+        later = _find_change(tz, transition + _YEAR - _WEEK, transition + _YEAR + _WEEK)
+        if later is not None:
+            tail.append(later)
+
+    for transition, offset in sorted(tail):
+        if transition < _HORIZON:
+            transitions_.append(transition)
+            offsets.append(offset)
+    return TransitionTable(tuple(transitions_), tuple(offsets), _HORIZON)
+
+
+def _find_change(tz, start, end, offset=None):
+    """
+    Return the first instant from ``start`` to ``end`` at which the offset of
+    ``tz`` differs from its offset at ``start``, or ``offset`` if given,
+    along with the new offset; or ``None`` if the offset at ``end`` is the
+    same. Between the two there must be at most one change.
+    """
+    if offset is None:
+        offset = _offset_at(tz, start)
+    if _offset_at(tz, end) == offset:
+        return None
+    while end - start > 1:
+        middle = (start + end) // 2
+        if _offset_at(tz, middle) == offset:
+            start = middle
+        else:
+            end = middle
+    return end, _offset_at(tz, end)
+
+
+def _offset_at(tz, seconds):
+    """
+    Return the UTC offset of ``tz`` in seconds at an instant in seconds.
+    """
+    return datetime.fromtimestamp(seconds, tz).utcoffset() // _SECOND
+
+
+def to_local(instants, tz):
+    """
+    Convert many UTC instants to ``tz`` at once, using its `TransitionTable`
+    rather than a zone lookup per instant.
+
+    :param instants: A NumPy ``datetime64`` array of UTC instants, such as
+        `delorean.parse_array` returns, or an iterable of `datetime`
+        objects, which are taken as UTC if they are naive.
+    :param tz: Anything `timezone` accepts.
+    :returns: For an array, a ``datetime64`` array of the local clock
+        readings, with ``NaT`` kept as it is. Otherwise a list of aware
+        datetimes in ``tz``, each equal to what `datetime.astimezone` would
+        return, ``fold`` included.
+
+    .. versionadded:: 2.1.0
+
+    .. testsetup::
+
+        from datetime import datetime
+        from delorean.timezones import to_local
+
+    .. doctest::
+
+        >>> to_local([datetime(2015, 7, 1, 12), datetime(2015, 12, 1, 12)], 'US/Eastern')
+        [datetime.datetime(2015, 7, 1, 8, 0, tzinfo=zoneinfo.ZoneInfo(key='US/Eastern')), datetime.datetime(2015, 12, 1, 7, 0, tzinfo=zoneinfo.ZoneInfo(key='US/Eastern'))]
+
+    """
+    tz = timezone(tz)
+    table = transitions(tz)
+    if getattr(instants, "dtype", None) is not None:
+        return _to_local_array(instants, tz, table)
+
+    transitions_, offsets, until = table
+    deltas = [timedelta(seconds=offset) for offset in offsets]
+    results = []
+    for dt in instants:
+        if dt.tzinfo is not None:
+            dt = dt.replace(tzinfo=None) - dt.utcoffset()
+        seconds = (dt - _EPOCH) // _SECOND
+        if until is not None and seconds >= until:
+            results.append(dt.replace(tzinfo=utc).astimezone(tz))
+            continue
+
+        i = bisect_right(transitions_, seconds)
+        # the second pass through a repeated hour after clocks go back
+        fold = (
+            i > 0
+            and offsets[i - 1] > offsets[i]
+            and seconds - transitions_[i - 1] < offsets[i - 1] - offsets[i]
+        )
+        results.append((dt + deltas[i]).replace(tzinfo=tz, fold=fold))
+    return results
+
+
+def _to_local_array(instants, tz, table):
+    import numpy
+
+    seconds = instants.astype("datetime64[s]").view(numpy.int64)
+    index = numpy.searchsorted(
+        numpy.array(table.transitions, dtype=numpy.int64), seconds, side="right"
+    )
+    offsets = numpy.array(table.offsets, dtype=numpy.int64)[index]
+    if table.until is not None:
+        beyond = (seconds >= table.until) & ~numpy.isnat(instants)
+        for i in numpy.flatnonzero(beyond):
+            offsets[i] = _offset_at(tz, int(seconds[i]))
+    return instants + offsets.astype("timedelta64[s]")
+
+
+_offset_index = None
+
+
+def zones_for_offset(offset, at=None):
+    """
+    Return the names of the zones whose UTC offset is ``offset`` at the
+    instant ``at``, in alphabetical order.
+
+    Only canonical names are returned, as `canonical_name` gives them. The
+    first call indexes the `TransitionTable` of every zone by offset, which
+    takes about a second unless `preload` has built the tables already;
+    after that each call is a binary search.
+
+    :param offset: A `timedelta`, or a number of seconds.
+    :param at: A `datetime`, taken as UTC if it is naive, or ``None`` for
+        now.
+
+    .. testsetup::
+
+        from datetime import datetime, timedelta
+        from delorean.timezones import zones_for_offset
+
+    .. doctest::
+
+        >>> zones_for_offset(timedelta(hours=5, minutes=30), datetime(2015, 7, 1))
+        ('Asia/Colombo', 'Asia/Kolkata')
+
+    .. versionadded:: 2.1.0
+    """
+    if isinstance(offset, timedelta):
+        offset = offset // _SECOND
+    if at is None:
+        seconds = int(time.time())
+    else:
+        if at.tzinfo is not None:
+            at = at.replace(tzinfo=None) - at.utcoffset()
+        seconds = (at - _EPOCH) // _SECOND
+
+    index, names = _offset_index or _build_offset_index()
+    if seconds >= _HORIZON:
+        # past the tables; ask each zone
+        return tuple(
+            name for name in names if _offset_at(timezone(name), seconds) == offset
+        )
+    try:
+        starts, zones = index[offset]
+    except KeyError:
+        return ()
+    return zones[bisect_right(starts, seconds) - 1]
+
+
+def _build_offset_index():
+    """
+    Build, for each offset, the instants at which the set of zones with that
+    offset changes, and the set from each of those instants on.
+    """
+    global _offset_index
+    names = []
+    changes = {}
+    for name in sorted({canonical_name(name) for name in available_timezones()}):
+        try:
+            transitions_, offsets, _ = transitions(name)
+        except DeloreanInvalidTimezone:
+            continue
+        names.append(name)
+        # past the last transition the offset holds until _HORIZON, which
+        # queries never search beyond
+        starts = (float("-inf"),) + transitions_
+        for i, offset in enumerate(offsets):
+            events = changes.setdefault(offset, [])
+            events.append((starts[i], 1, name))
+            if i < len(transitions_):
+                events.append((transitions_[i], -1, name))
+
+    index = {}
+    interned = {}
+    for offset, events in changes.items():
+        starts = [float("-inf")]
+        zones = [()]
+        current = set()
+        events.sort()
+        for start, group in groupby(events, key=lambda event: event[0]):
+            for _, step, name in group:
+                if step > 0:
+                    current.add(name)
+                else:
+                    current.discard(name)
+            members = tuple(sorted(current))
+            members = interned.setdefault(members, members)
+            if start == starts[-1]:
+                zones[-1] = members
+            else:
+                starts.append(start)
+                zones.append(members)
+        index[offset] = (starts, zones)
+
+    _offset_index = (index, tuple(names))
+    return _offset_index
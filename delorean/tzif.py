@@ -0,0 +1,255 @@
+"""
+Reading the compiled tz database directly.
+
+`zoneinfo` answers one question at a time: the offset at a given instant.
+Bulk conversion wants the whole history of a zone up front, as a sorted list
+of transitions it can search, so this module reads the same TZif files
+`zoneinfo` does (RFC 8536) and returns their transitions.
+
+It also packs many zones into one snapshot file, which a process can map
+into memory and load zones from without searching the filesystem. Build one
+with::
+
+    $ python -m delorean.tzif snapshot.tzs [ZONE ...]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from importlib import resources
+from zoneinfo import TZPATH, available_timezones
+
+_HEADER = struct.Struct(">4sc15x6l")
+
+_SNAPSHOT_MAGIC = b"DLTZSNP1"
+_SNAPSHOT_COUNT = struct.Struct(">L")
+_SNAPSHOT_ENTRY = struct.Struct(">H")
+_SNAPSHOT_SPAN = struct.Struct(">LL")
+
+
+def find(key):
+    """
+    Return the TZif data for the zone named ``key``, or ``None`` if there is
+    none. The search order is the one `zoneinfo` uses: each directory on
+    `zoneinfo.TZPATH`, then the ``tzdata`` package.
+    """
+    for root in TZPATH:
+        path = os.path.join(root, key)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                return f.read()
+
+    package, _, name = ("tzdata.zoneinfo/" + key).rpartition("/")
+    try:
+        return resources.files(package.replace("/", ".")).joinpath(name).read_bytes()
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def read(data):
+    """
+    Return ``(transitions, offsets, footer)`` from the TZif data ``data``.
+
+    ``transitions`` is a list of the UTC instants, in seconds since the epoch,
+    at which the zone's offset changes. ``offsets`` holds one more entry than
+    that: ``offsets[i]`` is the UTC offset in seconds in force before
+    ``transitions[i]``, and the last entry the one after the final
+    transition. ``footer`` is the POSIX TZ string that describes the zone
+    after the final transition, or ``""`` if there is none.
+
+    :raises ValueError: If ``data`` is not TZif data.
+    """
+    magic, version, *counts = _HEADER.unpack_from(data)
+    if magic != b"TZif":
+        raise ValueError("not TZif data")
+
+    if version == b"\x00":
+        transitions, offsets, _ = _read_block(data, _HEADER.size, counts, 4)
+        return transitions, offsets, ""
+
+    # version 2 and later repeat the data with 64-bit times after the version
+    # 1 block, followed by the footer; only the second copy is needed
+    end = _second_header(data, counts)
+    magic, version, *counts = _HEADER.unpack_from(data, end)
+    transitions, offsets, end = _read_block(data, end + _HEADER.size, counts, 8)
+    footer = data[end:].strip(b"\n").decode("ascii")
+    return transitions, offsets, footer
+
+
+def links():
+    """
+    Return a dict mapping each link in the tz database, such as
+    ``"US/Pacific"``, to the zone it names, such as
+    ``"America/Los_Angeles"``. Links to links are followed to the end. The
+    links come from the ``tzdata.zi`` file found the way `find` finds zones;
+    without one the dict is empty.
+    """
+    data = find("tzdata.zi")
+    if data is None:
+        return {}
+    targets = {}
+    for line in data.decode("utf-8").splitlines():
+        if line.startswith("L "):
+            _, target, name = line.split()[:3]
+            targets[name] = target
+    for name, target in targets.items():
+        while target in targets:
+            target = targets[target]
+        targets[name] = target
+    return targets
+
+
+def compact(data):
+    """
+    Return TZif data equivalent to ``data`` for any reader of version 2 or
+    later, with the redundant 32-bit version 1 block emptied out.
+    """
+    magic, version, *counts = _HEADER.unpack_from(data)
+    if magic != b"TZif":
+        raise ValueError("not TZif data")
+    if version == b"\x00":
+        return bytes(data)
+    start = _second_header(data, counts)
+    return _HEADER.pack(b"TZif", version, 0, 0, 0, 0, 0, 0) + bytes(data[start:])
+
+
+def _second_header(data, counts):
+    _, _, end = _read_block(data, _HEADER.size, counts, 4, skip=True)
+    return end
+
+
+def _read_block(data, start, counts, time_size, skip=False):
+    """
+    Read one TZif data block of ``time_size``-byte times starting at
+    ``start``, and return its transitions, offsets and where it ends.
+    """
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+    end = (
+        start
+        + timecnt * (time_size + 1)
+        + typecnt * 6
+        + charcnt
+        + leapcnt * (time_size + 4)
+        + isstdcnt
+        + isutcnt
+    )
+    if skip:
+        return None, None, end
+
+    code = "q" if time_size == 8 else "l"
+    transitions = list(struct.unpack_from(f">{timecnt}{code}", data, start))
+    start += timecnt * time_size
+    indices = data[start : start + timecnt]
+    start += timecnt
+    utoffs = [struct.unpack_from(">l", data, start + 6 * i)[0] for i in range(typecnt)]
+
+    # local time type 0 applies before the first transition
+    offsets = [utoffs[0]] + [utoffs[i] for i in indices]
+    return transitions, offsets, end
+
+
+def build_snapshot(path, names=None):
+    """
+    Write a snapshot of the zones ``names``, or of every available zone, to
+    ``path``, and return how many zones it holds.
+
+    Each zone is stored as compacted TZif data, so the snapshot carries the
+    same transitions, offsets, abbreviations and POSIX footer rule as the tz
+    database it was built from. Aliases whose data is identical share one
+    copy.
+
+    :raises ValueError: If one of ``names`` has no tz database entry.
+    """
+    if names is None:
+        names = sorted(available_timezones())
+    blobs = {}
+    index = []
+    for name in names:
+        data = find(name)
+        if data is None:
+            raise ValueError(f"No tz database entry for {name!r}")
+        index.append(
+            (name.encode("utf-8"), blobs.setdefault(compact(data), len(blobs)))
+        )
+
+    header = [_SNAPSHOT_MAGIC, _SNAPSHOT_COUNT.pack(len(index))]
+    size = len(_SNAPSHOT_MAGIC) + _SNAPSHOT_COUNT.size
+    size += sum(
+        _SNAPSHOT_ENTRY.size + len(key) + _SNAPSHOT_SPAN.size for key, _ in index
+    )
+    spans = []
+    for blob in blobs:
+        spans.append((size, len(blob)))
+        size += len(blob)
+    for key, number in index:
+        header.append(_SNAPSHOT_ENTRY.pack(len(key)) + key)
+        header.append(_SNAPSHOT_SPAN.pack(*spans[number]))
+
+    with open(path, "wb") as f:
+        f.writelines(header)
+        f.writelines(blobs)
+    return len(index)
+
+
+class Snapshot(object):
+    """
+    A snapshot file written by `build_snapshot`, mapped into memory.
+
+    It maps zone names to their TZif data; only the index is read when it is
+    opened, and each zone's data is paged in when it is asked for.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path!r} is not a delorean tz snapshot")
+
+        position = len(_SNAPSHOT_MAGIC)
+        (count,) = _SNAPSHOT_COUNT.unpack_from(self._map, position)
+        position += _SNAPSHOT_COUNT.size
+        self._index = {}
+        for _ in range(count):
+            (length,) = _SNAPSHOT_ENTRY.unpack_from(self._map, position)
+            position += _SNAPSHOT_ENTRY.size
+            key = self._map[position : position + length].decode("utf-8")
+            position += length
+            self._index[key] = _SNAPSHOT_SPAN.unpack_from(self._map, position)
+            position += _SNAPSHOT_SPAN.size
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __getitem__(self, key):
+        start, length = self._index[key]
+        return self._map[start : start + length]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        self._map.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m delorean.tzif",
+        description="Build a tz snapshot for delorean.timezones.use_snapshot.",
+    )
+    parser.add_argument("path", help="the snapshot file to write")
+    parser.add_argument(
+        "zones", nargs="*", help="zone names to include (default: all available)"
+    )
+    args = parser.parse_args(argv)
+    count = build_snapshot(args.path, args.zones or None)
+    print(f"wrote {count} zones to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
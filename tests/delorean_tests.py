@@ -5,16 +5,30 @@
 Testing for Delorean
 """
 
+import multiprocessing
+import os
+import pickle
+import tempfile
 import unittest
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import partial
 from unittest import mock
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, available_timezones
 
-from dateutil.parser import UnknownTimezoneWarning
+from dateutil.parser import UnknownTimezoneWarning, isoparse
+from dateutil.relativedelta import FR, MO, relativedelta
 from dateutil.tz import tzlocal, tzoffset
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import delorean
+from delorean.parsers import classify, compile_format, parse_iso
 
 
 def naive_utcnow():
@@ -849,6 +863,71 @@ class DeloreanTests(unittest.TestCase):
     def test_invalid_shift_name_is_not_reported_by_hasattr(self):
         self.assertFalse(hasattr(self.do, "next_bogus"))
 
+    def test_named_weekday_shifts_in_one_step(self):
+        # 2015-01-01 was a Thursday
+        dt = datetime(2015, 1, 1, 9, tzinfo=delorean.utc)
+        cases = [
+            ("next", "thursday", 1, datetime(2015, 1, 8, 9)),
+            ("next", "friday", 1, datetime(2015, 1, 2, 9)),
+            ("next", "wednesday", 3, datetime(2015, 1, 21, 9)),
+            ("last", "thursday", 1, datetime(2014, 12, 25, 9)),
+            ("last", "friday", 520, datetime(2005, 1, 14, 9)),
+            ("last", "monday", 0, datetime(2014, 12, 29, 9)),
+        ]
+        for direction, unit, num_shifts, expected in cases:
+            with self.subTest(direction=direction, unit=unit, num_shifts=num_shifts):
+                moved = delorean.move_datetime_namedday(dt, direction, unit, num_shifts)
+                self.assertEqual(moved, expected.replace(tzinfo=delorean.utc))
+
+    def test_shift_by(self):
+        do = delorean.Delorean(datetime(2015, 1, 31, 12), timezone="US/Pacific")
+        cases = [
+            ({"months": 1}, datetime(2015, 2, 28, 12)),
+            ({"years": 1, "months": -13}, datetime(2014, 12, 31, 12)),
+            ({"years": 1, "days": 29}, datetime(2016, 2, 29, 12)),
+            ({"weeks": 1, "hours": -12, "minutes": 30}, datetime(2015, 2, 7, 0, 30)),
+            ({"seconds": 1.5}, datetime(2015, 1, 31, 12, 0, 1, 500000)),
+            ({"weekday": 5}, datetime(2015, 1, 31, 12)),
+            ({"weekday": FR}, datetime(2015, 2, 6, 12)),
+            ({"weekday": FR(-1)}, datetime(2015, 1, 30, 12)),
+            ({"months": 1, "weekday": MO(+2)}, datetime(2015, 3, 9, 12)),
+        ]
+        for kwargs, expected in cases:
+            with self.subTest(kwargs=kwargs):
+                shifted = do.shift_by(**kwargs)
+                self.assertEqual(shifted.datetime.replace(tzinfo=None), expected)
+                self.assertEqual(shifted.timezone, do.timezone)
+                expected = do.datetime.replace(tzinfo=None) + relativedelta(**kwargs)
+                self.assertEqual(
+                    shifted, delorean.Delorean(expected, timezone="US/Pacific")
+                )
+        self.assertEqual(do.datetime, datetime(2015, 1, 31, 12, tzinfo=do.timezone))
+
+    def test_shift_by_keeps_wall_clock_across_dst(self):
+        do = delorean.Delorean(datetime(2013, 3, 9, 7), timezone="US/Eastern")
+
+        shifted = do.shift_by(days=1)
+
+        self.assertEqual(
+            shifted.datetime.strftime("%Y-%m-%d %H:%M %Z"), "2013-03-10 07:00 EDT"
+        )
+
+    def test_shift_by_rejects_fractional_months(self):
+        with self.assertRaisesRegex(TypeError, "integer"):
+            self.do.shift_by(months=0.5)
+        with self.assertRaises(ValueError):
+            self.do.shift_by(years=10000)
+
+    def test_shift_methods_are_defined_on_the_class(self):
+        for direction in self.do._VALID_SHIFT_DIRECTIONS:
+            for unit in self.do._VALID_SHIFT_UNITS:
+                name = f"{direction}_{unit}"
+                with self.subTest(name=name):
+                    method = vars(delorean.Delorean)[name]
+                    self.assertEqual(method.__name__, name)
+                    self.assertTrue(method.__doc__)
+        self.assertIn("next_friday", dir(self.do))
+
     def test_shift_across_dst_keeps_wall_clock(self):
         eastern = ZoneInfo("US/Eastern")
         do = delorean.Delorean(datetime(2013, 3, 9, 7, 0).replace(tzinfo=eastern))
@@ -975,6 +1054,102 @@ class DeloreanTests(unittest.TestCase):
         d = delorean.Delorean()
         self.assertNotEqual(d, None)
 
+    def test_slots(self):
+        d = delorean.Delorean(datetime(2015, 1, 1), timezone="US/Pacific")
+
+        self.assertFalse(hasattr(d, "__dict__"))
+        with self.assertRaises(AttributeError):
+            d.color = "red"
+        with self.assertRaises(AttributeError):
+            d.next_fortnight
+        self.assertEqual(d.next_day().date, date(2015, 1, 2))
+        for copied in [deepcopy(d), pickle.loads(pickle.dumps(d))]:
+            with self.subTest(copied=copied):
+                self.assertEqual(copied, d)
+                self.assertEqual(copied.timezone, d.timezone)
+
+    def test_pickles_with_every_protocol(self):
+        for cls in [delorean.Delorean, delorean.FrozenDelorean]:
+            d = cls(datetime(2015, 1, 1, 12, 30), timezone="US/Pacific")
+            d.timestamp
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(cls=cls, protocol=protocol):
+                    copied = pickle.loads(pickle.dumps(d, protocol))
+                    self.assertIs(type(copied), cls)
+                    self.assertEqual(repr(copied), repr(d))
+                    self.assertEqual(copied.timestamp, d.timestamp)
+
+    def test_loads_pickles_from_before_slots(self):
+        # a 2.0 Delorean, pickled with protocol 0 when it still had a __dict__
+        data = (
+            b"ccopy_reg\n_reconstructor\np0\n(cdelorean.dates\nDel"
+            b"orean\np1\nc__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nV_"
+            b"dt\np6\ncdatetime\ndatetime\np7\n(c_codecs\nencode\np8\n"
+            b"(V\x07\xdf\x01\x01\\u0000\\u0000\\u0000\\u0000\\u0000\\u0000\np9\nVl"
+            b"atin1\np10\ntp11\nRp12\nc__builtin__\ngetattr\np13\n(cz"
+            b"oneinfo\nZoneInfo\np14\nV_unpickle\np15\ntp16\nRp17\n(V"
+            b"UTC\np18\nI1\ntp19\nRp20\ntp21\nRp22\nsV_tzinfo\np23\ng20"
+            b"\nsb."
+        )
+
+        self.assertEqual(
+            pickle.loads(data), delorean.Delorean(datetime(2015, 1, 1), "UTC")
+        )
+
+    def test_timestamp_is_cached(self):
+        d = delorean.Delorean(
+            datetime(2015, 1, 1, 12, 30, 15, 5), timezone="US/Pacific"
+        )
+
+        self.assertEqual(d.timestamp, 1420144215.000005)
+        self.assertEqual(d._us, 1420144215000005)
+
+        d.shift("Asia/Tokyo")
+        self.assertEqual(d.timestamp, 1420144215.000005)
+
+        d.truncate("minute")
+        self.assertEqual(d.timestamp, 1420144200.0)
+        self.assertEqual(d.epoch, 1420144200.0)
+
+    def test_timestamp_far_from_epoch(self):
+        for dt in [
+            datetime(1, 1, 2, 0, 0, 0, 1),
+            datetime(9999, 12, 30, 23, 59, 59, 999999),
+        ]:
+            with self.subTest(dt=dt):
+                d = delorean.Delorean(dt, timezone="UTC")
+                expected = delorean.dates.get_total_second(dt - datetime(1970, 1, 1))
+                self.assertEqual(d.timestamp, expected)
+
+    def test_compare_microseconds_apart(self):
+        # too close for their float timestamps to tell apart
+        d1 = delorean.Delorean(datetime(9000, 1, 1), timezone="UTC")
+        d2 = delorean.Delorean(datetime(9000, 1, 1, 0, 0, 0, 1), timezone="UTC")
+
+        self.assertLess(d1, d2)
+        self.assertNotEqual(d1, d2)
+
+    def test_hash(self):
+        d1 = delorean.Delorean(datetime(2015, 1, 1), timezone="US/Pacific")
+        d2 = delorean.Delorean(datetime(2015, 1, 1, 8), timezone="UTC")
+        d3 = delorean.Delorean(datetime(2015, 1, 1, 8, 0, 0, 1), timezone="UTC")
+
+        self.assertEqual(hash(d1), hash(d2))
+        self.assertEqual(len({d1, d2, d3}), 2)
+        self.assertEqual({d1: "pacific"}[d2], "pacific")
+
+    def test_sort_key(self):
+        d1 = delorean.Delorean(datetime(2015, 1, 1), timezone="US/Pacific")
+        d2 = delorean.Delorean(datetime(2015, 1, 1, 7), timezone="UTC")
+        d3 = delorean.Delorean(datetime(2014, 12, 31, 23, 59), timezone="UTC")
+
+        self.assertEqual(d1.sort_key(), 1420099200000000)
+        self.assertEqual(d1.sort_key(), d1.shift("Asia/Tokyo").sort_key())
+        self.assertEqual(
+            sorted([d1, d2, d3], key=delorean.Delorean.sort_key), [d3, d2, d1]
+        )
+        self.assertEqual(sorted([d1, d2, d3]), [d3, d2, d1])
+
     def test_equal(self):
         d1 = delorean.Delorean()
         d2 = deepcopy(d1)
@@ -1242,5 +1417,1793 @@ class StdlibTimezoneTests(unittest.TestCase):
         )
 
 
+class IsoFastPathTests(unittest.TestCase):
+    """`parse_iso` must agree with `isoparse` wherever it answers at all."""
+
+    HANDLED = [
+        "2015-01-01",
+        "2015-01-01T10:30",
+        "2015-01-01 10:30:15",
+        "2024-05-01T12:34:56.123456Z",
+        "2024-05-01T12:34:56.1Z",
+        "2024-05-01T12:34:56,25z",
+        "2024-05-01T12:34:56.123456789+00:00",
+        "2024-05-01T12:34:56-00:00",
+        "2024-05-01T12:34:56+05:30",
+        "2024-05-01T12:34:56-0800",
+        "2024-05-01T12:34:56+01",
+        "2024-05-01T12:34-03:00",
+    ]
+
+    NOT_HANDLED = [
+        "20150101",
+        "2015-W01-2",
+        "2015-01-01T10",
+        "2015-01-01T24:00:00",
+        "2015-01-01x10:30",
+        "2015-13-01",
+        "2015-01-01T10:30:00 -0800",
+        "2015-01-01T10:30:00+24:00",
+        "Thu Sep 25 10:36:28 2003",
+        "２０１５-01-01",
+        1420070400,
+    ]
+
+    def test_agrees_with_isoparse(self):
+        for text in self.HANDLED:
+            with self.subTest(text=text):
+                fast = parse_iso(text)
+                slow = isoparse(text)
+
+                self.assertIsNotNone(fast)
+                self.assertEqual(fast.replace(tzinfo=None), slow.replace(tzinfo=None))
+                self.assertEqual(fast.utcoffset(), slow.utcoffset())
+
+    def test_reads_binary_input(self):
+        for text in self.HANDLED:
+            data = b"[" + text.encode() + b"]"
+            for value in (data, bytearray(data), memoryview(data)):
+                with self.subTest(text=text, type=type(value)):
+                    fast = parse_iso(value, 1, len(data) - 1)
+
+                    self.assertEqual(fast, parse_iso(text))
+                    self.assertEqual(fast.utcoffset(), parse_iso(text).utcoffset())
+
+    def test_returns_stdlib_timezones(self):
+        self.assertIs(parse_iso("2024-05-01T12:34:56Z").tzinfo, delorean.utc)
+        self.assertIs(parse_iso("2024-05-01T12:34:56+00:00").tzinfo, delorean.utc)
+        self.assertIsInstance(parse_iso("2024-05-01T12:34:56+05:30").tzinfo, timezone)
+        self.assertIsNone(parse_iso("2024-05-01T12:34:56").tzinfo)
+
+    def test_declines_other_layouts(self):
+        for text in self.NOT_HANDLED:
+            with self.subTest(text=text):
+                self.assertIsNone(parse_iso(text))
+
+    def test_parse_results_are_unchanged(self):
+        for text in self.HANDLED + self.NOT_HANDLED[:5]:
+            with self.subTest(text=text):
+                with mock.patch("delorean.interface.parse_iso", return_value=None):
+                    expected = delorean.parse(text)
+                do = delorean.parse(text)
+
+                self.assertEqual(repr(do), repr(expected))
+                self.assertEqual(do.timezone, expected.timezone)
+
+
+class FormatParsingTests(unittest.TestCase):
+    """`compile_format` must read what `datetime.strptime` reads."""
+
+    CASES = [
+        ("%d/%b/%Y:%H:%M:%S %z", "10/Oct/2000:13:55:36 -0700"),
+        ("%d/%b/%Y:%H:%M:%S %z", "10/oct/2000:13:55:36 +0000"),
+        ("%Y-%m-%d %H:%M:%S.%f", "2015-01-01 00:01:02.25"),
+        ("%a, %d %B %Y %I:%M %p", "Thu, 1 January 2015 12:30 AM"),
+        ("%A %d %B %Y %I:%M %p", "Thursday 01 January 2015 12:30 pm"),
+        ("%y%m%d", "150101"),
+        ("%y%m%d", "700101"),
+        ("%Y %j", "2016 366"),
+        ("%H:%M", "7:05"),
+        ("%Y-%m-%dT%H:%M:%S%z", "2015-01-01T00:01:02+05:30"),
+        ("%Y-%m-%dT%H:%M:%S%z", "2015-01-01T00:01:02Z"),
+        ("%Y-%m-%d  %H", "2015-01-01 \t 10"),
+        ("100%% %Y", "100% 2015"),
+    ]
+
+    def test_agrees_with_strptime(self):
+        for format, text in self.CASES:
+            with self.subTest(format=format, text=text):
+                expected = datetime.strptime(text, format)
+                dt = compile_format(format).match(text)
+
+                self.assertEqual(dt.replace(tzinfo=None), expected.replace(tzinfo=None))
+                self.assertEqual(dt.utcoffset(), expected.utcoffset())
+
+    def test_strings_are_parsed_once(self):
+        capture = delorean.interface.capture
+        for text in [
+            "Thu, 01 Jan 2015 00:00:00 +0000",
+            "Thu, 01 Jan 2015 00:00:00 UTC",
+            "Thu, 01 Jan 2015 00:00:00 GMT",
+            "Thu, 01 Jan 2015 00:00:00 XYZ",
+        ]:
+            for tzname in [("UTC", "UTC"), ("GMT", "BST"), ("EST", "EDT")]:
+                with self.subTest(text=text, tzname=tzname):
+                    with (
+                        mock.patch("time.tzname", tzname),
+                        mock.patch("delorean.interface.capture", wraps=capture) as spy,
+                        warnings.catch_warnings(),
+                    ):
+                        warnings.simplefilter("ignore", UnknownTimezoneWarning)
+                        delorean.parse(text)
+
+                    self.assertEqual(spy.call_count, 1)
+
+    def test_zero_offset_is_utc(self):
+        dt = compile_format("%Y-%m-%d %z").match("2015-01-01 +0000")
+
+        self.assertIs(dt.tzinfo, delorean.utc)
+
+    def test_mismatch_returns_none(self):
+        self.assertIsNone(compile_format("%Y-%m-%d").match("2015/01/01"))
+        self.assertIsNone(compile_format("%Y-%m-%d").match("2015-01-01 10:00"))
+        self.assertIsNone(compile_format("%Y-%m-%d").match("2015-02-30"))
+
+    def test_unsupported_directive_is_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_format("%Y week %U")
+
+    def test_repeated_directive_is_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_format("%Y %Y")
+
+    def test_formats_are_compiled_once(self):
+        compile_format.cache_clear()
+        for _ in range(3):
+            delorean.parse("10/Oct/2000:13:55:36 -0700", formats="%d/%b/%Y:%H:%M:%S %z")
+
+        info = compile_format.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_parse_with_format(self):
+        do = delorean.parse(
+            "10/Oct/2000:13:55:36 -0700", formats="%d/%b/%Y:%H:%M:%S %z"
+        )
+
+        self.assertEqual(
+            do.datetime,
+            datetime(2000, 10, 10, 13, 55, 36, tzinfo=timezone(timedelta(hours=-7))),
+        )
+        self.assertEqual(do.timezone, timezone(timedelta(hours=-7)))
+
+    def test_parse_tries_formats_in_order(self):
+        # dateutil would read this day first; the formats say otherwise.
+        do = delorean.parse("01/05/2009", formats=["%Y", "%m/%d/%Y", "%d/%m/%Y"])
+
+        self.assertEqual(do.date, date(2009, 1, 5))
+
+    def test_parse_with_format_assumes_timezone(self):
+        do = delorean.parse(
+            "2015-01-01 10:00", formats="%Y-%m-%d %H:%M", assume_timezone="US/Eastern"
+        )
+
+        self.assertEqual(str(do.timezone), "US/Eastern")
+        self.assertEqual(do.datetime.utcoffset(), timedelta(hours=-5))
+
+    def test_parse_falls_back_when_no_format_matches(self):
+        do = delorean.parse("2015-01-01T10:00:00Z", formats="%d/%m/%Y")
+
+        self.assertEqual(do, delorean.parse("2015-01-01T10:00:00Z"))
+
+
+class ParseManyTests(unittest.TestCase):
+    MIXED = [
+        "2015-01-01T00:01:02Z",
+        "2015-01-01 00:01:02 -0800",
+        "Thu Sep 25 10:36:28 2003",
+        "2015-02-04T16:33:21.247513",
+        "01/05/2009",
+    ]
+
+    def assertSameAsParse(self, strings, results, **kwargs):
+        expected = [delorean.parse(text, **kwargs) for text in strings]
+
+        self.assertEqual([repr(d) for d in results], [repr(d) for d in expected])
+
+    def test_results_match_parse(self):
+        strings = ["2015-01-%02dT10:00:00Z" % day for day in range(1, 31)]
+
+        self.assertSameAsParse(strings, delorean.parse_many(strings))
+
+    def test_mixed_input_matches_parse(self):
+        self.assertSameAsParse(self.MIXED, delorean.parse_many(self.MIXED))
+
+    def test_arguments_are_passed_through(self):
+        kwargs = {"dayfirst": False, "assume_timezone": "US/Eastern"}
+
+        self.assertSameAsParse(
+            self.MIXED, delorean.parse_many(self.MIXED, **kwargs), **kwargs
+        )
+
+    def test_infers_iso(self):
+        stream = delorean.parse_many(["2015-01-01T00:00:00Z"] * 3)
+        list(stream)
+
+        self.assertEqual(stream.format, "iso")
+
+    def test_infers_a_common_format(self):
+        strings = ["Thu, 01 Jan 2015 10:00:%02d -0700" % s for s in range(60)]
+        stream = delorean.parse_many(strings)
+
+        self.assertSameAsParse(strings, stream)
+        self.assertEqual(stream.format, "%a, %d %b %Y %H:%M:%S %z")
+
+    def test_does_not_infer_a_format_that_disagrees_with_parse(self):
+        # parse reads these day first, so %m/%d/%Y must not be picked
+        strings = ["01/05/2009", "02/05/2009"]
+        stream = delorean.parse_many(strings)
+
+        self.assertSameAsParse(strings, stream)
+        self.assertEqual(stream.format, "%d/%m/%Y")
+
+    def test_unambiguous_sample_does_not_lock_in_the_other_order(self):
+        # day > 12 in every sampled row, so only dayfirst tells the orders
+        # apart on the ambiguous row that follows
+        strings = [
+            "05/%02d/2009 %02d:00:00" % (day, hour)
+            for hour in [1, 2]
+            for day in range(13, 32)
+        ]
+        strings.append("05/06/2009 10:00:00")
+        for dayfirst in [True, False]:
+            with self.subTest(dayfirst=dayfirst):
+                stream = delorean.parse_many(strings, dayfirst=dayfirst)
+
+                self.assertSameAsParse(strings, stream, dayfirst=dayfirst)
+                self.assertEqual(
+                    stream.format, None if dayfirst else "%m/%d/%Y %H:%M:%S"
+                )
+
+    def test_year_first_layouts_follow_dayfirst(self):
+        strings = [
+            "2009/05/%02d %02d:00:00" % (day, hour)
+            for hour in [1, 2]
+            for day in range(13, 32)
+        ]
+        strings.append("2009/05/06 10:00:00")
+
+        self.assertSameAsParse(strings, delorean.parse_many(strings))
+        self.assertEqual(delorean.parse("2009/05/06 10:00:00").date, date(2009, 6, 5))
+
+    def test_mixed_sample_infers_nothing(self):
+        stream = delorean.parse_many(self.MIXED)
+        list(stream)
+
+        self.assertIsNone(stream.format)
+
+    def test_explicit_formats(self):
+        strings = ["05/06/2013", "2013-05-07"]
+        stream = delorean.parse_many(strings, formats="%m/%d/%Y")
+
+        self.assertEqual([d.date for d in stream], [date(2013, 5, 6), date(2013, 5, 7)])
+
+    def test_is_lazy(self):
+        def strings():
+            yield "2015-01-01T00:00:00Z"
+            yield "2015-01-02T00:00:00Z"
+            raise AssertionError("read past the sample")
+
+        stream = delorean.parse_many(strings(), sample=1)
+
+        self.assertEqual(next(stream).date, date(2015, 1, 1))
+        self.assertEqual(next(stream).date, date(2015, 1, 2))
+
+    def test_errors_raise_by_default(self):
+        stream = delorean.parse_many(["2015-01-01", "asd"])
+
+        self.assertEqual(next(stream).date, date(2015, 1, 1))
+        self.assertRaises(ValueError, next, stream)
+
+    def test_errors_skip(self):
+        stream = delorean.parse_many(["asd", "2015-01-01", None], errors="skip")
+
+        self.assertEqual([d.date for d in stream], [date(2015, 1, 1)])
+        self.assertEqual(stream.errors, [])
+
+    def test_errors_collect(self):
+        strings = ["asd", "2015-01-01", None, "2015-01-02T00:00:00"]
+        stream = delorean.parse_many(strings, assume_timezone=None, errors="collect")
+
+        self.assertEqual(list(stream), [])
+        self.assertEqual([index for index, _ in stream.errors], [0, 1, 2, 3])
+        self.assertIsInstance(stream.errors[1][1], delorean.DeloreanInvalidDatetime)
+
+    def test_unknown_error_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            delorean.parse_many([], errors="ignore")
+
+
+class EpochParsingTests(unittest.TestCase):
+    def test_units(self):
+        expected = datetime(2015, 1, 1, 0, 0, 0, 123000)
+        for text, unit in [
+            ("1420070400.123", "s"),
+            ("1420070400123", "ms"),
+            ("1420070400123000", "us"),
+            ("1420070400123000000", "ns"),
+        ]:
+            with self.subTest(unit=unit):
+                do = delorean.parse(text, epoch_unit=unit)
+                self.assertEqual(do.naive, expected)
+                self.assertEqual(do.timezone, delorean.utc)
+
+    def test_auto_judges_unit_from_digits(self):
+        for text in ["1420070400", "1420070400000", "1420070400000000"]:
+            with self.subTest(text=text):
+                do = delorean.parse(text, epoch_unit="auto")
+                self.assertEqual(do.naive, datetime(2015, 1, 1))
+
+    def test_matches_from_timestamp(self):
+        for text in ["0", "1420070400.5", "-1.25", "951782400"]:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    delorean.parse(text, epoch_unit="s"),
+                    delorean.from_timestamp(float(text)),
+                )
+
+    def test_sub_microsecond_digits_round_half_even(self):
+        for text, microsecond in [("500", 0), ("1500", 2), ("2501", 3)]:
+            with self.subTest(text=text):
+                do = delorean.parse(text, epoch_unit="ns")
+                self.assertEqual(do.naive.microsecond, microsecond)
+
+    def test_other_strings_parse_as_usual(self):
+        do = delorean.parse("2015-01-01 00:01:02 -0800", epoch_unit="s")
+
+        self.assertEqual(do, delorean.parse("2015-01-01 00:01:02 -0800"))
+
+    def test_not_an_epoch_without_epoch_unit(self):
+        do = delorean.parse("20150101")
+
+        self.assertEqual(do.naive, datetime(2015, 1, 1))
+
+    def test_unknown_unit_is_rejected(self):
+        with self.assertRaises(ValueError):
+            delorean.parse("2015-01-01", epoch_unit="days")
+
+    def test_timezone_override_applies(self):
+        do = delorean.parse("1420070400", epoch_unit="s", timezone="US/Eastern")
+
+        self.assertEqual(do.naive, datetime(2015, 1, 1, 5))
+
+    def test_parse_many(self):
+        strings = ["1420070400", "1420070401", "2015-01-01T00:00:02Z"]
+
+        results = list(delorean.parse_many(strings, epoch_unit="s"))
+
+        self.assertEqual(results, [delorean.parse(s, epoch_unit="s") for s in strings])
+
+    def test_epoch_route_is_counted(self):
+        delorean.reset_parse_stats()
+
+        delorean.parse("1420070400", epoch_unit="s")
+
+        self.assertEqual(delorean.parse_stats(), {"epoch": 1})
+
+
+class BinaryInputTests(unittest.TestCase):
+    LINE = b"2015-01-01 00:01:02 INFO served 2015-01-01T00:01:02-08:00 in 3ms"
+
+    def test_types(self):
+        expected = delorean.parse("2015-01-01T00:01:02-08:00")
+        data = b"2015-01-01T00:01:02-08:00"
+        for value in (data, bytearray(data), memoryview(data)):
+            with self.subTest(type=type(value)):
+                self.assertEqual(repr(delorean.parse(value)), repr(expected))
+
+    def test_offset_and_length(self):
+        do = delorean.parse(self.LINE, offset=32, length=25)
+
+        self.assertEqual(repr(do), repr(delorean.parse("2015-01-01T00:01:02-08:00")))
+
+    def test_offset_reads_to_the_end(self):
+        do = delorean.parse(memoryview(b"at 10 Oct 2000 13:55"), offset=3)
+
+        self.assertEqual(do.naive, datetime(2000, 10, 10, 13, 55))
+
+    def test_offset_and_length_of_text(self):
+        do = delorean.parse("at 2015-01-01 then", offset=3, length=10)
+
+        self.assertEqual(do.naive, datetime(2015, 1, 1))
+
+    def test_other_layouts_are_decoded(self):
+        data = "1 février 2015 10:00".encode()
+        with self.assertRaises(ValueError):
+            delorean.parse(data)
+
+        do = delorean.parse(b"[Jan 1 2015 10:00]", offset=1, length=16)
+
+        self.assertEqual(do.naive, datetime(2015, 1, 1, 10))
+
+    def test_rfc3339_is_read_in_place(self):
+        with mock.patch("delorean.interface._decode") as decode:
+            delorean.parse(self.LINE, offset=32, length=25)
+
+        decode.assert_not_called()
+
+    def test_invalid_utf8_is_a_value_error(self):
+        with self.assertRaises(ValueError):
+            delorean.parse(b"\xff2015")
+
+    def test_epoch_numbers(self):
+        do = delorean.parse(b"t=1420070400;", epoch_unit="s", offset=2, length=10)
+
+        self.assertEqual(do.naive, datetime(2015, 1, 1))
+
+    def test_parse_many(self):
+        lines = [b"x 2015-01-01 00:01:02 +0100", b"x 2015-01-02 00:01:02 +0100"]
+
+        results = list(delorean.parse_many(lines, offset=2))
+
+        self.assertEqual(results, [delorean.parse(line.decode()[2:]) for line in lines])
+
+    def test_parse_many_infers_layout_from_binary_samples(self):
+        lines = [
+            b"Thu, 01 Jan 2015 00:01:02 +0100 GET",
+            b"Fri, 02 Jan 2015 00:01:02 +0100 PUT",
+        ]
+
+        stream = delorean.parse_many(lines, length=31)
+        results = list(stream)
+
+        self.assertEqual(stream.format, "%a, %d %b %Y %H:%M:%S %z")
+        self.assertEqual(results[1], delorean.parse("Fri, 02 Jan 2015 00:01:02 +0100"))
+
+
+class AbbreviationTests(unittest.TestCase):
+    def tearDown(self):
+        delorean.timezones.set_abbreviation_regions(
+            "north_america", "europe", "asia", "australia"
+        )
+
+    def test_abbreviations_become_fixed_offsets(self):
+        for text, hours in [
+            ("Thu, 01 Jan 2015 10:00:00 EST", -5),
+            ("Jan 1 2015 10:00 PDT", -7),
+            ("2015-01-01 10:00 CEST", 2),
+            ("2015-01-01 10:00 AEDT", 11),
+        ]:
+            with self.subTest(text=text):
+                do = delorean.parse(text)
+
+                self.assertEqual(do.datetime.utcoffset(), timedelta(hours=hours))
+                self.assertIsInstance(do.timezone, timezone)
+
+    def test_numeric_offset_wins_over_abbreviation(self):
+        for text, hours in [
+            ("Mon, 01 Jan 2015 10:00:00 +0200 (IST)", 2),
+            ("Mon, 01 Jan 2015 10:00:00 +0300 (AST)", 3),
+            ("Mon, 01 Jan 2015 10:00:00 -0000 (EST)", 0),
+        ]:
+            with self.subTest(text=text):
+                do = delorean.parse(text)
+
+                self.assertEqual(do.datetime.utcoffset(), timedelta(hours=hours))
+
+    def test_unknown_names_still_warn(self):
+        with self.assertWarns(UnknownTimezoneWarning):
+            do = delorean.parse("Jan 1 2015 10:00 XYZ")
+
+        self.assertEqual(do.timezone, delorean.utc)
+
+    def test_zero_offset_is_utc(self):
+        do = delorean.parse("2015-01-01 10:00 WET")
+
+        self.assertIs(do.timezone, delorean.utc)
+
+    def test_regions_resolve_ambiguity(self):
+        text = "2015-01-01 10:00 CST"
+        self.assertEqual(delorean.parse(text).datetime.utcoffset(), timedelta(hours=-6))
+
+        delorean.timezones.set_abbreviation_regions("asia", "north_america")
+
+        self.assertEqual(delorean.parse(text).datetime.utcoffset(), timedelta(hours=8))
+
+    def test_left_out_regions_are_not_consulted(self):
+        delorean.timezones.set_abbreviation_regions("europe")
+
+        with self.assertWarns(UnknownTimezoneWarning):
+            delorean.parse("2015-01-01 10:00 PST")
+
+    def test_unknown_region(self):
+        with self.assertRaises(ValueError):
+            delorean.timezones.set_abbreviation_regions("atlantis")
+
+    def test_local_abbreviations_are_left_to_the_local_zone(self):
+        with mock.patch("time.tzname", ("EST", "EDT")):
+            table = delorean.timezones.abbreviations()
+
+        self.assertNotIn("EST", table)
+        self.assertIn("PST", table)
+
+    def test_table_is_built_once(self):
+        self.assertIs(
+            delorean.timezones.abbreviations(), delorean.timezones.abbreviations()
+        )
+
+
+class TimezoneResolverTests(unittest.TestCase):
+    def test_names_resolve_to_one_object(self):
+        self.assertIs(delorean.timezone("US/Eastern"), delorean.timezone("US/Eastern"))
+        self.assertIs(delorean.timezone("UTC"), delorean.utc)
+
+    def test_offsets_are_interned(self):
+        offset_timezone = delorean.timezones.offset_timezone
+        tz = delorean.timezone("UTC-08:00")
+
+        self.assertIs(delorean.timezone(tzoffset(None, -8 * 3600)), tz)
+        self.assertIs(offset_timezone(timedelta(hours=-8)), tz)
+        self.assertIs(offset_timezone(-8 * 3600), tz)
+        self.assertIs(
+            delorean.parse("2015-01-01 00:01:02 -0800").timezone,
+            delorean.parse("2015-01-01T00:01:02-08:00").timezone,
+        )
+
+    def test_unknown_names_are_not_remembered(self):
+        for _ in range(2):
+            with self.assertRaises(delorean.DeloreanInvalidTimezone):
+                delorean.timezone("Not/AZone")
+
+        self.assertNotIn("Not/AZone", delorean.timezones._names)
+
+    def test_cache_clear(self):
+        eastern = delorean.timezone("US/Eastern")
+
+        delorean.timezone.cache_clear()
+
+        self.assertIsNot(delorean.timezone("US/Eastern"), eastern)
+        self.assertEqual(delorean.timezone("US/Eastern").key, eastern.key)
+        self.assertIs(delorean.timezone("UTC"), delorean.utc)
+
+
+class TransitionTableTests(unittest.TestCase):
+    ZONES = ["US/Eastern", "Europe/London", "Australia/Lord_Howe", "Asia/Kolkata"]
+
+    def instants(self):
+        start = datetime(1890, 1, 1)
+        step = timedelta(days=37, hours=5, minutes=11)
+        instants = [start + step * i for i in range(2500)]
+        # each side of the 2013 Eastern transitions, in UTC
+        instants += [
+            datetime(2013, 3, 10, 6, 30) + timedelta(minutes=m) for m in range(60)
+        ]
+        instants += [
+            datetime(2013, 11, 3, 5) + timedelta(minutes=m) for m in range(150)
+        ]
+        return instants
+
+    def test_table_layout(self):
+        table = delorean.timezones.transitions("US/Eastern")
+
+        self.assertEqual(list(table.transitions), sorted(table.transitions))
+        self.assertEqual(len(table.offsets), len(table.transitions) + 1)
+        self.assertIn(1362898800, table.transitions)
+        self.assertIsNotNone(table.until)
+
+    def test_table_is_built_once(self):
+        self.assertIs(
+            delorean.timezones.transitions("Europe/Paris"),
+            delorean.timezones.transitions(ZoneInfo("Europe/Paris")),
+        )
+
+    def test_zone_without_daylight_saving_holds_forever(self):
+        table = delorean.timezones.transitions("Asia/Kolkata")
+
+        self.assertIsNone(table.until)
+        self.assertEqual(table.offsets[-1], 19800)
+
+    def test_fixed_offset(self):
+        table = delorean.timezones.transitions("UTC-08:00")
+
+        self.assertEqual(table, ((), (-28800,), None))
+
+    def test_zone_without_data(self):
+        with self.assertRaises(delorean.DeloreanInvalidTimezone):
+            delorean.timezones.transitions(tzlocal())
+
+    def test_to_local_matches_astimezone(self):
+        instants = self.instants()
+        for name in self.ZONES + ["UTC-08:00"]:
+            tz = delorean.timezone(name)
+            with self.subTest(zone=name):
+                results = delorean.timezones.to_local(instants, tz)
+
+                for dt, local in zip(instants, results):
+                    expected = dt.replace(tzinfo=timezone.utc).astimezone(tz)
+                    self.assertEqual(
+                        local.replace(tzinfo=None), expected.replace(tzinfo=None)
+                    )
+                    self.assertEqual(local.fold, expected.fold)
+                    self.assertIs(local.tzinfo, tz)
+
+    def test_to_local_accepts_aware_datetimes(self):
+        dt = datetime(2015, 7, 1, 8, tzinfo=delorean.timezone("UTC-04:00"))
+
+        (local,) = delorean.timezones.to_local([dt], "Europe/London")
+
+        self.assertEqual(local, dt)
+        self.assertEqual(local.hour, 13)
+
+    def test_to_local_beyond_the_table(self):
+        dt = datetime(2150, 7, 1, 12)
+
+        (local,) = delorean.timezones.to_local([dt], "US/Eastern")
+
+        self.assertEqual(local.hour, 8)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_local_array(self):
+        instants = self.instants() + [datetime(2150, 7, 1, 12)]
+        array = numpy.array(instants + [None], dtype="datetime64[us]")
+        for name in self.ZONES:
+            tz = delorean.timezone(name)
+            with self.subTest(zone=name):
+                results = delorean.timezones.to_local(array, tz)
+
+                self.assertEqual(results.dtype, array.dtype)
+                self.assertTrue(numpy.isnat(results[-1]))
+                self.assertEqual(
+                    results[:-1].tolist(),
+                    [
+                        dt.replace(tzinfo=timezone.utc)
+                        .astimezone(tz)
+                        .replace(tzinfo=None)
+                        for dt in instants
+                    ],
+                )
+
+    def test_tzif_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            delorean.tzif.read(b"not a zone file" * 4)
+
+
+class LocalizeManyTests(unittest.TestCase):
+    # Eastern clocks jump 02:00 EST -> 03:00 EDT on 2013-03-10 and fall back
+    # 02:00 EDT -> 01:00 EST on 2013-11-03.
+    GAP = datetime(2013, 3, 10, 2, 30)
+    OVERLAP = datetime(2013, 11, 3, 1, 30)
+    ORDINARY = datetime(2013, 7, 1, 12)
+
+    def localize(self, value, **policy):
+        (result,) = delorean.localize_many([value], "US/Eastern", **policy)
+        return result
+
+    def test_ordinary_readings_match_localize(self):
+        values = [datetime(2013, 1, 1) + timedelta(hours=7 * i) for i in range(1300)]
+        values = [v for v in values if v != self.GAP and v != self.OVERLAP]
+
+        results = delorean.localize_many(values, "US/Eastern", ambiguous="raise")
+
+        self.assertEqual(results, [delorean.localize(v, "US/Eastern") for v in values])
+
+    def test_ambiguous(self):
+        earliest = self.localize(self.OVERLAP)
+        latest = self.localize(self.OVERLAP, ambiguous="latest")
+
+        self.assertEqual(earliest.utcoffset(), timedelta(hours=-4))
+        self.assertEqual(latest.utcoffset(), timedelta(hours=-5))
+        self.assertEqual((earliest.fold, latest.fold), (0, 1))
+        self.assertIsNone(self.localize(self.OVERLAP, ambiguous="NaT"))
+        with self.assertRaises(delorean.DeloreanInvalidDatetime):
+            self.localize(self.OVERLAP, ambiguous="raise")
+
+    def test_policy_overrides_input_fold(self):
+        for value in [self.OVERLAP, datetime(2150, 11, 1, 1, 30)]:
+            with self.subTest(value=value):
+                value = value.replace(fold=1)
+                earliest = self.localize(value, ambiguous="earliest")
+                latest = self.localize(value.replace(fold=0), ambiguous="latest")
+
+                self.assertEqual(earliest.utcoffset(), timedelta(hours=-4))
+                self.assertEqual(latest.utcoffset(), timedelta(hours=-5))
+                self.assertEqual((earliest.fold, latest.fold), (0, 1))
+
+    def test_nonexistent(self):
+        forward = self.localize(self.GAP)
+        backward = self.localize(self.GAP, nonexistent="shift_backward")
+
+        self.assertEqual(forward.replace(tzinfo=None), datetime(2013, 3, 10, 3))
+        self.assertEqual(
+            backward.replace(tzinfo=None), datetime(2013, 3, 10, 1, 59, 59, 999999)
+        )
+        self.assertEqual(
+            forward.astimezone(timezone.utc) - backward.astimezone(timezone.utc),
+            timedelta(microseconds=1),
+        )
+        with self.assertRaises(delorean.DeloreanInvalidDatetime):
+            self.localize(self.GAP, nonexistent="raise")
+
+    def test_beyond_the_transition_table(self):
+        overlap = datetime(2150, 11, 1, 1, 30)
+        gap = datetime(2150, 3, 8, 2, 30)
+
+        self.assertEqual(
+            self.localize(overlap, ambiguous="latest").utcoffset(),
+            timedelta(hours=-5),
+        )
+        self.assertEqual(
+            self.localize(gap).replace(tzinfo=None), datetime(2150, 3, 8, 3)
+        )
+        self.assertEqual(
+            self.localize(gap, nonexistent="shift_backward").replace(tzinfo=None),
+            datetime(2150, 3, 8, 1, 59, 59, 999999),
+        )
+
+    def test_fixed_offset(self):
+        tz = delorean.timezone("UTC-08:00")
+
+        results = delorean.localize_many([self.GAP, self.OVERLAP], tz)
+
+        self.assertEqual(
+            results, [self.GAP.replace(tzinfo=tz), self.OVERLAP.replace(tzinfo=tz)]
+        )
+
+    def test_rejects_aware_values(self):
+        with self.assertRaises(delorean.DeloreanInvalidDatetime):
+            delorean.localize_many([datetime(2013, 1, 1, tzinfo=timezone.utc)], "UTC")
+
+    def test_rejects_unknown_policies(self):
+        with self.assertRaises(ValueError):
+            delorean.localize_many([], "UTC", ambiguous="first")
+        with self.assertRaises(ValueError):
+            delorean.localize_many([], "UTC", nonexistent="skip")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_array(self):
+        values = [
+            self.ORDINARY,
+            self.GAP,
+            self.OVERLAP,
+            None,
+            datetime(2150, 11, 1, 1, 30),
+        ]
+        array = numpy.array(values, dtype="datetime64[s]")
+
+        instants = delorean.localize_many(array, "US/Eastern", ambiguous="latest")
+
+        self.assertEqual(instants.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(
+            instants.tolist(),
+            [
+                datetime(2013, 7, 1, 16),
+                datetime(2013, 3, 10, 7),
+                datetime(2013, 11, 3, 6, 30),
+                None,
+                datetime(2150, 11, 1, 6, 30),
+            ],
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_array_policies(self):
+        array = numpy.array([self.GAP, self.OVERLAP], dtype="datetime64[us]")
+
+        instants = delorean.localize_many(
+            array, "US/Eastern", ambiguous="NaT", nonexistent="shift_backward"
+        )
+
+        self.assertEqual(
+            instants.tolist(), [datetime(2013, 3, 10, 6, 59, 59, 999999), None]
+        )
+        with self.assertRaises(delorean.DeloreanInvalidDatetime):
+            delorean.localize_many(array, "US/Eastern", ambiguous="raise")
+        with self.assertRaises(delorean.DeloreanInvalidDatetime):
+            delorean.localize_many(array, "US/Eastern", nonexistent="raise")
+
+
+class LocalTimezoneTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch(
+            "delorean.timezones.reload_localzone", return_value=ZoneInfo("US/Eastern")
+        )
+        self.reload = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(delorean.timezones.refresh_local_timezone)
+        delorean.timezones.refresh_local_timezone()
+        self.reload.reset_mock()
+
+    def test_zone_is_remembered(self):
+        for _ in range(3):
+            self.assertEqual(
+                delorean.timezones.local_timezone(), ZoneInfo("US/Eastern")
+            )
+
+        self.reload.assert_not_called()
+
+    def test_filesystem_is_not_touched_between_checks(self):
+        with mock.patch("os.stat") as stat:
+            delorean.timezones.local_timezone()
+
+        stat.assert_not_called()
+
+    def test_tz_variable_change_is_noticed(self):
+        self.reload.return_value = ZoneInfo("Asia/Tokyo")
+
+        with mock.patch.dict(os.environ, {"TZ": "Asia/Tokyo"}):
+            self.assertEqual(
+                delorean.timezones.local_timezone(), ZoneInfo("Asia/Tokyo")
+            )
+
+        self.reload.assert_called_once_with()
+
+    def test_localtime_is_checked_after_the_interval(self):
+        with mock.patch("delorean.timezones.LOCAL_CHECK_INTERVAL", 0):
+            with mock.patch("delorean.timezones._localtime_mtime", return_value=1):
+                delorean.timezones.local_timezone()
+                delorean.timezones.local_timezone()
+
+        self.reload.assert_called_once_with()
+
+    def test_refresh(self):
+        self.reload.return_value = ZoneInfo("Asia/Tokyo")
+
+        self.assertEqual(
+            delorean.timezones.refresh_local_timezone(), ZoneInfo("Asia/Tokyo")
+        )
+        self.assertEqual(delorean.timezones.local_timezone(), ZoneInfo("Asia/Tokyo"))
+
+    def test_now_uses_the_remembered_zone(self):
+        self.assertEqual(delorean.now().timezone, ZoneInfo("US/Eastern"))
+        self.assertEqual(delorean.Delorean.now().timezone, ZoneInfo("US/Eastern"))
+        self.reload.assert_not_called()
+
+
+class PreloadTests(unittest.TestCase):
+    def test_zones_and_tables_are_pinned(self):
+        delorean.timezones.preload(["Europe/Paris", "UTC-03:00"])
+        tz = delorean.timezone("Europe/Paris")
+
+        ZoneInfo.clear_cache()
+
+        self.assertIs(delorean.timezone("Europe/Paris"), tz)
+        self.assertIn(tz, delorean.timezones._tables)
+
+    def test_tables_are_optional(self):
+        delorean.timezone.cache_clear()
+
+        delorean.timezones.preload(["Europe/Rome"], tables=False)
+
+        self.assertIn("Europe/Rome", delorean.timezones._names)
+        self.assertEqual(delorean.timezones._tables, {})
+
+    def test_unknown_names_are_rejected(self):
+        with self.assertRaises(delorean.DeloreanInvalidTimezone):
+            delorean.timezones.preload(["Europe/Paris", "Not/AZone"])
+
+    def test_every_available_zone(self):
+        with mock.patch(
+            "delorean.timezones.available_timezones",
+            return_value={"Asia/Tokyo", "Not/AZone"},
+        ):
+            delorean.timezones.preload()
+
+        self.assertIn("Asia/Tokyo", delorean.timezones._names)
+
+
+class SnapshotTests(unittest.TestCase):
+    NAMES = ["US/Eastern", "America/New_York", "Europe/London", "Asia/Kolkata"]
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "zones.tzs")
+        delorean.tzif.build_snapshot(self.path, self.NAMES)
+        self.addCleanup(delorean.timezones.use_snapshot, None)
+
+    def test_zones_come_from_the_snapshot(self):
+        delorean.timezones.use_snapshot(self.path)
+
+        tz = delorean.timezone("US/Eastern")
+
+        self.assertIsNot(tz, ZoneInfo("US/Eastern"))
+        self.assertEqual(repr(tz), repr(ZoneInfo("US/Eastern")))
+        for instant in [
+            datetime(1950, 1, 1),
+            datetime(2015, 7, 1),
+            datetime(2080, 7, 1),
+        ]:
+            instant = instant.replace(tzinfo=timezone.utc)
+            with self.subTest(instant=instant):
+                local = instant.astimezone(tz)
+                expected = instant.astimezone(ZoneInfo("US/Eastern"))
+                self.assertEqual(local.utcoffset(), expected.utcoffset())
+                self.assertEqual(local.tzname(), expected.tzname())
+
+    def test_zones_pickle_by_name(self):
+        delorean.timezones.use_snapshot(self.path)
+        d = delorean.Delorean(datetime(2015, 7, 1, 12), timezone="US/Eastern")
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                copied = pickle.loads(pickle.dumps(d, protocol))
+                self.assertEqual(repr(copied), repr(d))
+                self.assertIs(copied.timezone, d.timezone)
+
+        data = pickle.dumps(d)
+        delorean.timezones.use_snapshot(None)
+
+        self.assertIs(pickle.loads(data).timezone, ZoneInfo("US/Eastern"))
+
+    def test_spawned_workers_use_the_snapshot(self):
+        delorean.timezones.use_snapshot(self.path)
+        path = os.path.join(os.path.dirname(self.path), "times.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(["2015-07-01 10:00"] * 30))
+        spawn = partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+
+        with mock.patch("delorean.interface.ProcessPoolExecutor", spawn):
+            parsed = delorean.parse_file(
+                path,
+                workers=2,
+                chunk_size=100,
+                stream=True,
+                assume_timezone="US/Eastern",
+            )
+            timezones = {d.timezone for d in parsed}
+
+        self.assertEqual(timezones, {delorean.timezone("US/Eastern")})
+        self.assertIsNot(delorean.timezone("US/Eastern"), ZoneInfo("US/Eastern"))
+
+    def test_transition_tables_match(self):
+        expected = delorean.timezones.transitions("Europe/London")
+
+        delorean.timezones.use_snapshot(self.path)
+
+        self.assertEqual(delorean.timezones.transitions("Europe/London"), expected)
+
+    def test_missing_names_fall_back_to_the_tz_database(self):
+        delorean.timezones.use_snapshot(self.path)
+
+        self.assertIs(delorean.timezone("Europe/Paris"), ZoneInfo("Europe/Paris"))
+
+    def test_stop_using_snapshot(self):
+        delorean.timezones.use_snapshot(self.path)
+        delorean.timezones.use_snapshot(None)
+
+        self.assertIs(delorean.timezone("US/Eastern"), ZoneInfo("US/Eastern"))
+
+    def test_aliases_share_data(self):
+        snapshot = delorean.tzif.Snapshot(self.path)
+        self.addCleanup(snapshot.close)
+
+        self.assertEqual(sorted(snapshot), sorted(self.NAMES))
+        self.assertEqual(
+            snapshot._index["US/Eastern"], snapshot._index["America/New_York"]
+        )
+        self.assertEqual(
+            delorean.tzif.read(snapshot["Asia/Kolkata"]),
+            delorean.tzif.read(delorean.tzif.find("Asia/Kolkata")),
+        )
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot")
+
+        with self.assertRaises(ValueError):
+            delorean.timezones.use_snapshot(self.path)
+
+    def test_unknown_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            delorean.tzif.build_snapshot(self.path, ["Not/AZone"])
+
+    def test_command_line(self):
+        with mock.patch("builtins.print"):
+            delorean.tzif.main([self.path, "Asia/Tokyo"])
+
+        snapshot = delorean.tzif.Snapshot(self.path)
+        self.addCleanup(snapshot.close)
+        self.assertEqual(list(snapshot), ["Asia/Tokyo"])
+
+
+class CanonicalNameTests(unittest.TestCase):
+    def test_links_resolve_to_their_zone(self):
+        self.assertEqual(
+            delorean.timezones.canonical_name("US/Pacific"), "America/Los_Angeles"
+        )
+        self.assertEqual(
+            delorean.timezones.canonical_name("America/Los_Angeles"),
+            "America/Los_Angeles",
+        )
+        self.assertEqual(delorean.timezones.canonical_name("Not/AZone"), "Not/AZone")
+
+    def test_utc_spellings(self):
+        for name in ["UTC", "Etc/UTC", "Zulu", "Etc/Universal"]:
+            with self.subTest(name=name):
+                self.assertIs(delorean.timezone(name, canonical=True), delorean.utc)
+
+    def test_aliases_keep_their_spelling_by_default(self):
+        tz = delorean.timezone("US/Pacific")
+
+        self.assertEqual(tz.key, "US/Pacific")
+        self.assertEqual(
+            delorean.Delorean(datetime(2015, 1, 1), timezone="US/Pacific").timezone,
+            tz,
+        )
+
+    def test_canonical_zone_is_shared(self):
+        tz = delorean.timezone("America/Los_Angeles")
+
+        self.assertIs(delorean.timezone("US/Pacific", canonical=True), tz)
+        self.assertIs(
+            delorean.timezone(delorean.timezone("US/Pacific"), canonical=True), tz
+        )
+        self.assertIs(delorean.timezone(tz, canonical=True), tz)
+
+    def test_aliases_share_transition_tables(self):
+        delorean.timezone.cache_clear()
+
+        table = delorean.timezones.transitions("US/Pacific")
+
+        self.assertIs(delorean.timezones.transitions("America/Los_Angeles"), table)
+
+    def test_without_tzdata_zi(self):
+        delorean.timezone.cache_clear()
+        self.addCleanup(delorean.timezone.cache_clear)
+
+        with mock.patch("delorean.tzif.find", return_value=None):
+            self.assertEqual(
+                delorean.timezones.canonical_name("US/Pacific"), "US/Pacific"
+            )
+
+
+class ZonesForOffsetTests(unittest.TestCase):
+    def test_matches_every_zone(self):
+        names = sorted(
+            {delorean.timezones.canonical_name(name) for name in available_timezones()}
+        )
+        instants = [
+            datetime(1900, 1, 1),
+            datetime(1985, 10, 27, 6, 30),
+            datetime(2015, 3, 8, 7),
+            datetime(2015, 7, 1),
+        ]
+        for instant in instants:
+            for hours in [-5, -4, 0, 1, 5.5, 10]:
+                offset = timedelta(hours=hours)
+                with self.subTest(instant=instant, offset=offset):
+                    expected = tuple(
+                        name
+                        for name in names
+                        if instant.replace(tzinfo=timezone.utc)
+                        .astimezone(delorean.timezone(name))
+                        .utcoffset()
+                        == offset
+                    )
+                    self.assertEqual(
+                        delorean.timezones.zones_for_offset(offset, instant), expected
+                    )
+
+    def test_aware_instants_and_seconds(self):
+        instant = datetime(2015, 1, 1, 7, tzinfo=ZoneInfo("US/Eastern"))
+
+        zones = delorean.timezones.zones_for_offset(-5 * 3600, instant)
+
+        self.assertIn("America/New_York", zones)
+        self.assertNotIn("US/Eastern", zones)
+        self.assertEqual(
+            zones,
+            delorean.timezones.zones_for_offset(
+                timedelta(hours=-5), datetime(2015, 1, 1, 12)
+            ),
+        )
+
+    def test_dst_switch(self):
+        before = datetime(2015, 3, 8, 6, 59, 59)
+        after = datetime(2015, 3, 8, 7)
+
+        self.assertIn(
+            "America/New_York",
+            delorean.timezones.zones_for_offset(timedelta(hours=-5), before),
+        )
+        self.assertIn(
+            "America/New_York",
+            delorean.timezones.zones_for_offset(timedelta(hours=-4), after),
+        )
+
+    def test_unused_offset(self):
+        self.assertEqual(
+            delorean.timezones.zones_for_offset(
+                timedelta(hours=20), datetime(2015, 1, 1)
+            ),
+            (),
+        )
+
+    def test_beyond_transition_tables(self):
+        zones = delorean.timezones.zones_for_offset(
+            timedelta(hours=-4), datetime(2150, 7, 1)
+        )
+
+        self.assertIn("America/New_York", zones)
+        self.assertNotIn("America/Chicago", zones)
+
+    def test_now(self):
+        self.assertIn("UTC", delorean.timezones.zones_for_offset(0))
+
+
+class DeltaTests(unittest.TestCase):
+    def test_matches_relativedelta(self):
+        eastern = ZoneInfo("US/Eastern")
+        starts = [
+            datetime(2015, 1, 31, 12),
+            datetime(2016, 2, 29, 23, 59, 59, 999999),
+            datetime(2013, 11, 3, 1, 30, fold=1, tzinfo=eastern),
+            datetime(1999, 12, 31, tzinfo=delorean.utc),
+            date(2015, 3, 31),
+        ]
+        shifts = [
+            {"months": 1},
+            {"months": -13},
+            {"years": 1, "days": -1},
+            {"weeks": 2, "hours": 5, "minutes": -61},
+            {"seconds": 1.5, "microseconds": 7},
+            {"days": 1},
+        ]
+        for start in starts:
+            for kwargs in shifts:
+                with self.subTest(start=start, kwargs=kwargs):
+                    delta = delorean.Delta(**kwargs)
+                    for moved, expected in [
+                        (start + delta, start + relativedelta(**kwargs)),
+                        (start - delta, start - relativedelta(**kwargs)),
+                    ]:
+                        self.assertEqual(repr(moved), repr(expected))
+                        self.assertEqual(
+                            getattr(moved, "fold", 0), getattr(expected, "fold", 0)
+                        )
+
+    def test_interned(self):
+        self.assertIs(delorean.Delta(months=1), delorean.Delta(months=1))
+        self.assertIs(delorean.Delta(years=1), delorean.Delta(months=12))
+        self.assertIs(delorean.Delta(days=1), delorean.Delta(hours=24))
+        self.assertIs(
+            pickle.loads(pickle.dumps(delorean.Delta(weeks=1))), delorean.Delta(days=7)
+        )
+        self.assertEqual(
+            -delorean.Delta(months=2, seconds=1), delorean.Delta(months=-2, seconds=-1)
+        )
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            delorean.Delta(months=1).months = 2
+
+    def test_rejects_fractional_months(self):
+        self.assertIs(delorean.Delta(months=2.0), delorean.Delta(months=2))
+        with self.assertRaisesRegex(TypeError, "integer"):
+            delorean.Delta(months=1.5)
+        with self.assertRaises(TypeError):
+            delorean.Delta(days=1) + datetime(2015, 1, 1)
+
+    def test_month_lengths(self):
+        for year, expected in [(2015, 28), (2016, 29), (1900, 28), (2000, 29)]:
+            with self.subTest(year=year):
+                moved = datetime(year, 1, 31) + delorean.Delta(months=1)
+                self.assertEqual(moved, datetime(year, 2, expected))
+
+
+class FrozenDeloreanTests(unittest.TestCase):
+    def setUp(self):
+        self.do = delorean.FrozenDelorean(
+            datetime(2015, 1, 31, 12, 15, 30), timezone="US/Pacific"
+        )
+
+    def test_transforms_return_new_objects(self):
+        truncated = self.do.truncate("day")
+        shifted = self.do.shift("UTC")
+        naive = self.do.naive
+
+        self.assertIsInstance(truncated, delorean.FrozenDelorean)
+        self.assertEqual(truncated.datetime.replace(tzinfo=None), datetime(2015, 1, 31))
+        self.assertEqual(shifted.timezone, delorean.utc)
+        self.assertEqual(shifted, self.do)
+        self.assertEqual(naive, datetime(2015, 1, 31, 20, 15, 30))
+        self.assertEqual(
+            self.do.datetime.replace(tzinfo=None), datetime(2015, 1, 31, 12, 15, 30)
+        )
+        self.assertEqual(self.do.timezone, ZoneInfo("US/Pacific"))
+
+    def test_derived_objects_are_frozen(self):
+        derived = [
+            self.do.midnight,
+            self.do.end_of_month,
+            self.do.next_month(),
+            self.do.last_friday(2),
+            self.do.shift_by(days=1),
+            self.do.replace(hour=1),
+            self.do + timedelta(hours=1),
+            self.do - timedelta(hours=1),
+        ]
+        for d in derived:
+            with self.subTest(d=d):
+                self.assertIsInstance(d, delorean.FrozenDelorean)
+        self.assertEqual(
+            self.do - self.do.midnight, timedelta(hours=12, minutes=15, seconds=30)
+        )
+
+    def test_derived_values_match_delorean(self):
+        plain = delorean.Delorean(
+            datetime(2015, 1, 31, 12, 15, 30), timezone="US/Pacific"
+        )
+        names = [
+            "timestamp",
+            "epoch",
+            "date",
+            "midnight",
+            "start_of_day",
+            "end_of_day",
+            "start_of_month",
+            "end_of_month",
+            "start_of_year",
+            "end_of_year",
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(self.do, name), getattr(plain, name))
+        self.assertEqual(
+            self.do.format_datetime(locale="de_DE"),
+            plain.format_datetime(locale="de_DE"),
+        )
+        self.assertEqual(self.do.next_month(), plain.next_month())
+        self.assertEqual(
+            repr(self.do),
+            "FrozenDelorean(datetime=datetime.datetime(2015, 1, 31, 12, 15, 30), timezone='US/Pacific')",
+        )
+
+    def test_derived_values_are_computed_once(self):
+        for name in ["date", "midnight", "end_of_month", "naive"]:
+            with self.subTest(name=name):
+                self.assertIs(getattr(self.do, name), getattr(self.do, name))
+        self.assertIs(self.do.format_datetime("long"), self.do.format_datetime("long"))
+        self.assertIs(repr(self.do), repr(self.do))
+
+        with mock.patch("delorean.dates.format_datetime", return_value="x") as format_:
+            frozen = delorean.FrozenDelorean(datetime(2015, 1, 1), timezone="UTC")
+            frozen.format_datetime()
+            frozen.format_datetime()
+        format_.assert_called_once()
+
+    def test_hashable_and_equal_to_delorean(self):
+        plain = delorean.Delorean(datetime(2015, 1, 31, 20, 15, 30), timezone="UTC")
+
+        self.assertEqual(self.do, plain)
+        self.assertEqual(len({self.do, plain}), 1)
+
+    def test_no_new_attributes(self):
+        with self.assertRaises(AttributeError):
+            self.do.color = "red"
+
+    def test_now(self):
+        self.assertIsInstance(
+            delorean.FrozenDelorean.now("UTC"), delorean.FrozenDelorean
+        )
+
+    def test_copies(self):
+        self.do.end_of_month
+        for copied in [deepcopy(self.do), pickle.loads(pickle.dumps(self.do))]:
+            with self.subTest(copied=copied):
+                self.assertIsInstance(copied, delorean.FrozenDelorean)
+                self.assertEqual(copied, self.do)
+                self.assertEqual(copied.end_of_month, self.do.end_of_month)
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = delorean.ParseCache(maxsize=2)
+
+    def test_results_match_parse(self):
+        for text in ["2015-01-01 00:01:02 -0800", "2013-09-30T15:34:00.000Z"] * 2:
+            with self.subTest(text=text):
+                do = self.cache.parse(text, assume_timezone="US/Eastern")
+                expected = delorean.parse(text, assume_timezone="US/Eastern")
+
+                self.assertEqual(repr(do), repr(expected))
+                self.assertEqual(do.timezone, expected.timezone)
+
+    def test_counts_hits_and_misses(self):
+        self.cache.parse("2015-01-01")
+        self.cache.parse("2015-01-01")
+        self.cache.parse("2015-01-01", assume_timezone="US/Eastern")
+
+        self.assertEqual(
+            self.cache.info(), delorean.interface.ParseCacheInfo(1, 2, 0, 2, 2)
+        )
+
+    def test_key_includes_every_argument(self):
+        first = self.cache.parse("01/05/2009")
+        second = self.cache.parse("01/05/2009", dayfirst=False)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.cache.info().misses, 2)
+
+    def test_key_includes_timezone_settings(self):
+        text = "2015-01-01 10:00 CST"
+        self.addCleanup(
+            delorean.timezones.set_abbreviation_regions,
+            "north_america",
+            "europe",
+            "asia",
+            "australia",
+        )
+        self.assertEqual(self.cache.parse(text).datetime.utcoffset().days, -1)
+
+        delorean.timezones.set_abbreviation_regions("asia", "north_america")
+
+        self.assertEqual(
+            self.cache.parse(text).datetime.utcoffset(), timedelta(hours=8)
+        )
+        with (
+            mock.patch("time.tzname", ("CST", "CDT")),
+            mock.patch("delorean.interface.get_localzone") as local,
+        ):
+            for name in ["US/Central", "US/Central", "Asia/Shanghai"]:
+                local.return_value = ZoneInfo(name)
+                self.assertEqual(self.cache.parse(text).timezone, ZoneInfo(name))
+
+        info = self.cache.info()
+        self.assertEqual((info.hits, info.misses), (1, 4))
+
+    def test_evicts_least_recently_used(self):
+        self.cache.parse("2015-01-01")
+        self.cache.parse("2015-01-02")
+        self.cache.parse("2015-01-01")
+        self.cache.parse("2015-01-03")
+        self.cache.parse("2015-01-01")
+        self.cache.parse("2015-01-02")
+
+        info = self.cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (2, 4, 2))
+        self.assertEqual(info.currsize, 2)
+
+    def test_mutating_a_result_does_not_touch_the_cache(self):
+        self.cache.parse("2015-01-01T12:30:00Z").truncate("day").shift("US/Pacific")
+
+        do = self.cache.parse("2015-01-01T12:30:00Z")
+
+        self.assertEqual(repr(do), repr(delorean.parse("2015-01-01T12:30:00Z")))
+        self.assertIsNot(do, self.cache.parse("2015-01-01T12:30:00Z"))
+
+    def test_failures_are_not_cached(self):
+        for _ in range(2):
+            self.assertRaises(ValueError, self.cache.parse, "asd")
+
+        self.assertEqual(self.cache.info().currsize, 0)
+
+    def test_list_of_formats_is_accepted(self):
+        self.cache.parse("05/06/2013", formats=["%m/%d/%Y"])
+        do = self.cache.parse("05/06/2013", formats=["%m/%d/%Y"])
+
+        self.assertEqual(do.date, date(2013, 5, 6))
+        self.assertEqual(self.cache.info().hits, 1)
+
+    def test_binary_input_is_keyed_on_its_bytes(self):
+        line = b'ts="2015-01-01T00:01:02Z" level=info'
+        buffer = bytearray(line)
+        views = [memoryview(buffer), memoryview(line), buffer, line]
+
+        for value in views:
+            with self.subTest(value=value):
+                do = self.cache.parse(value, offset=4, length=20)
+                self.assertEqual(repr(do), repr(delorean.parse(line[4:24])))
+
+        self.cache.parse(b"2015-01-01T00:01:02Z")
+        self.assertEqual((self.cache.info().hits, self.cache.info().misses), (4, 1))
+
+    def test_binary_input_is_read_at_call_time(self):
+        buffer = bytearray(b"2015-01-01")
+        self.cache.parse(memoryview(buffer))
+        buffer[:] = b"2016-02-02"
+
+        self.assertEqual(self.cache.parse(memoryview(buffer)).date, date(2016, 2, 2))
+
+    def test_clear(self):
+        self.cache.parse("2015-01-01")
+        self.cache.clear()
+
+        self.assertEqual(
+            self.cache.info(), delorean.interface.ParseCacheInfo(0, 0, 0, 2, 0)
+        )
+
+    def test_maxsize_must_be_positive(self):
+        self.assertRaises(ValueError, delorean.ParseCache, maxsize=0)
+
+
+class ParserRoutingTests(unittest.TestCase):
+    STRINGS = [
+        "2015-01-01T00:01:02Z",
+        "2015-01-01 00:01:02 -0800",
+        "2015-01-01T24:00:00",
+        "20150101T101112",
+        "2015-W01-2",
+        "2015",
+        "2015 01 01",
+        "2015/01/01 00:00:00 -0700",
+        " 201-01-01",
+        "+201-01-01",
+        "2_01-01-01",
+        "Thu Sep 25 10:36:28 2003",
+        "Thu, 01 Jan 2015 10:00:00 -0700",
+        "01/05/2009",
+        "10:30",
+    ]
+
+    def setUp(self):
+        delorean.reset_parse_stats()
+
+    def test_classification(self):
+        cases = {
+            "2015-01-01T00:01:02Z": "rfc3339",
+            "2015-01-01": "rfc3339",
+            "20150101": "iso",
+            "2015-W01": "iso",
+            "2015": "iso",
+            " 201-01-01": "rfc3339",
+            " 201/01/01": "generic",
+            " 2010101": "iso",
+            "2015/01/01": "generic",
+            "Thu Sep 25 10:36:28 2003": "generic",
+            "01/05/2009": "generic",
+            "201": "generic",
+            "２０１５-01-01": "generic",
+            b"2015-01-01": "iso",
+        }
+        for text, route in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(classify(text), route)
+
+    def test_routing_does_not_change_results(self):
+        for text in self.STRINGS:
+            with self.subTest(text=text):
+                with mock.patch("delorean.interface.classify", return_value="iso"):
+                    expected = delorean.parse(text)
+                do = delorean.parse(text)
+
+                self.assertEqual(repr(do), repr(expected))
+
+    def test_generic_strings_skip_the_iso_parser(self):
+        with mock.patch("delorean.interface.isocapture") as isocapture:
+            delorean.parse("Thu Sep 25 10:36:28 2003")
+            delorean.parse("2015/01/01 00:00:00 -0700")
+
+        isocapture.assert_not_called()
+
+    def test_routes_are_counted(self):
+        delorean.parse("2015-01-01T00:01:02Z")
+        delorean.parse("2015-01-01 00:01:02 -0800")
+        delorean.parse("20150101")
+        delorean.parse("Thu Sep 25 10:36:28 2003")
+        delorean.parse("Thu Sep 25 10:36:28 2003", isofirst=False)
+        delorean.parse("05/06/2013", formats="%m/%d/%Y")
+
+        self.assertEqual(
+            delorean.parse_stats(),
+            {"rfc3339": 2, "fallback": 1, "iso": 1, "generic": 2, "formats": 1},
+        )
+
+    def test_stats_reset(self):
+        delorean.parse("2015-01-01")
+        delorean.reset_parse_stats()
+
+        self.assertEqual(delorean.parse_stats(), {})
+
+    def test_inference_probes_are_not_counted(self):
+        matcher = delorean.interface._matcher
+        parsed = []
+
+        def parse_elsewhere(format):
+            # another thread parsing while the probes run
+            parsed.append(delorean.parse("2015-01-01"))
+            return matcher(format)
+
+        delorean.interface._candidates.cache_clear()
+        self.addCleanup(delorean.interface._candidates.cache_clear)
+        with mock.patch("delorean.interface._matcher", parse_elsewhere):
+            delorean.interface._candidates(True, True, True)
+
+        self.assertTrue(parsed)
+        self.assertEqual(delorean.parse_stats(), {"rfc3339": len(parsed)})
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ParseArrayTests(unittest.TestCase):
+    STRINGS = [
+        "2015-01-01T00:01:02Z",
+        "2015-01-01 00:01:02 -0800",
+        "2015-07-04T12:00:00",
+        "Thu Sep 25 10:36:28 2003",
+        "2013-03-10T02:30:00.250000",
+    ]
+
+    def assertMatchesParse(self, strings, **kwargs):
+        parsed = delorean.parse_array(strings, **kwargs)
+
+        self.assertEqual(parsed.instants.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(parsed.offsets.dtype, numpy.dtype("int32"))
+        for text, instant, offset in zip(strings, parsed.instants, parsed.offsets):
+            with self.subTest(text=text):
+                do = delorean.parse(text, **kwargs)
+                # read the offset first: .naive shifts the object to UTC
+                self.assertEqual(int(offset), do.datetime.utcoffset().total_seconds())
+                self.assertEqual(instant.item(), do.naive)
+
+    def test_matches_parse(self):
+        self.assertMatchesParse(self.STRINGS)
+
+    def test_assume_timezone_matches_parse(self):
+        self.assertMatchesParse(self.STRINGS, assume_timezone="US/Eastern")
+
+    def test_timezone_override_matches_parse(self):
+        self.assertMatchesParse(self.STRINGS, timezone="US/Pacific")
+
+    def test_inferred_layout_matches_parse(self):
+        strings = ["2015-01-%02dT10:00:00+05:30" % day for day in range(1, 31)]
+
+        self.assertMatchesParse(strings)
+
+    def test_inferred_layout_follows_dayfirst(self):
+        strings = [
+            "05/%02d/2009 %02d:00:00" % (day, hour)
+            for hour in [1, 2]
+            for day in range(13, 32)
+        ]
+        strings.append("05/06/2009 10:00:00")
+
+        self.assertMatchesParse(strings)
+        self.assertMatchesParse(strings, dayfirst=False)
+
+    def test_fixed_zones_match_parse(self):
+        strings = ["2015-01-%02dT10:00:00" % day for day in range(1, 31)]
+        strings.append("2015-01-01T10:00:00-03:00")
+
+        self.assertMatchesParse(strings, assume_timezone="UTC+05:30")
+        self.assertMatchesParse(strings, timezone="UTC-02:00")
+
+    def test_impossible_date_in_uniform_input(self):
+        strings = ["2015-02-%02dT00:00:00Z" % day for day in range(1, 31)]
+        parsed = delorean.parse_array(strings, errors="coerce")
+
+        self.assertEqual(
+            numpy.isnat(parsed.instants).tolist(), [False] * 28 + [True] * 2
+        )
+
+    def test_errors_raise_by_default(self):
+        self.assertRaises(ValueError, delorean.parse_array, ["2015-01-01", "asd"])
+
+    def test_missing_timezone_is_an_error_when_nothing_is_assumed(self):
+        with self.assertRaises(delorean.DeloreanInvalidDatetime):
+            delorean.parse_array(["2015-01-01"], assume_timezone=None)
+
+    def test_errors_coerce(self):
+        parsed = delorean.parse_array(
+            ["asd", "2015-01-01T00:00:00+01:00", None], errors="coerce"
+        )
+
+        self.assertTrue(numpy.isnat(parsed.instants[0]))
+        self.assertTrue(numpy.isnat(parsed.instants[2]))
+        self.assertEqual(
+            parsed.instants[1], numpy.datetime64("2014-12-31T23:00:00", "us")
+        )
+        self.assertEqual(parsed.offsets.tolist(), [0, 3600, 0])
+
+    def test_unknown_error_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            delorean.parse_array([], errors="skip")
+
+    def test_empty_input(self):
+        parsed = delorean.parse_array([])
+
+        self.assertEqual(len(parsed.instants), 0)
+        self.assertEqual(len(parsed.offsets), 0)
+
+    def test_epoch_numbers(self):
+        strings = ["1420070400123", "2015-01-01T00:00:00-08:00", "1e3"]
+
+        parsed = delorean.parse_array(strings, epoch_unit="ms", errors="coerce")
+
+        self.assertEqual(
+            parsed.instants.tolist()[:2],
+            [datetime(2015, 1, 1, 0, 0, 0, 123000), datetime(2015, 1, 1, 8)],
+        )
+        self.assertEqual(parsed.offsets.tolist(), [0, -8 * 3600, 0])
+        self.assertTrue(numpy.isnat(parsed.instants[2]))
+
+    def test_epoch_numbers_outside_datetime_range(self):
+        with self.assertRaises(OverflowError):
+            delorean.parse_array(["999999999999"], epoch_unit="s")
+
+    def test_binary_input(self):
+        lines = [
+            memoryview(b"> 2015-01-01T00:00:00-08:00 <"),
+            bytearray(b"> 2015-01-01 00:00:00      <"),
+            b"> not a date at all        <",
+        ]
+
+        parsed = delorean.parse_array(lines, offset=2, length=25, errors="coerce")
+
+        self.assertEqual(
+            parsed.instants.tolist()[:2],
+            [datetime(2015, 1, 1, 8), datetime(2015, 1, 1)],
+        )
+        self.assertEqual(parsed.offsets.tolist(), [-8 * 3600, 0, 0])
+
+    def test_numpy_is_optional(self):
+        with mock.patch.dict("sys.modules", {"numpy": None}):
+            with self.assertRaisesRegex(ImportError, "delorean\\[numpy\\]"):
+                delorean.parse_array(["2015-01-01"])
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ParseFileTests(unittest.TestCase):
+    def write(self, text):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        return path
+
+    def assertParsedAs(self, parsed, strings):
+        expected = delorean.parse_array(strings)
+
+        self.assertEqual(parsed.instants.tolist(), expected.instants.tolist())
+        self.assertEqual(parsed.offsets.tolist(), expected.offsets.tolist())
+
+    def test_whole_lines(self):
+        strings = ["2015-01-%02dT10:00:00-05:00" % day for day in range(1, 31)]
+        path = self.write("\n".join(strings) + "\n\n")
+
+        self.assertParsedAs(delorean.parse_file(path, workers=1), strings)
+
+    def test_chunks_keep_file_order(self):
+        strings = ["2015-01-%02dT10:00:00Z" % day for day in range(1, 31)]
+        path = self.write("\n".join(strings))
+
+        parsed = delorean.parse_file(path, workers=1, chunk_size=7)
+
+        self.assertParsedAs(parsed, strings)
+
+    def test_worker_processes(self):
+        strings = ["2015-01-%02dT10:00:00+01:00" % day for day in range(1, 31)]
+        path = self.write("\n".join(strings))
+
+        parsed = delorean.parse_file(path, workers=2, chunk_size=100)
+
+        self.assertParsedAs(parsed, strings)
+
+    def test_spawned_workers_share_timezone_settings(self):
+        strings = ["2015-01-%02d 10:00 CST" % day for day in range(1, 31)]
+        path = self.write("\n".join(strings))
+        delorean.timezones.set_abbreviation_regions("asia", "north_america")
+        self.addCleanup(
+            delorean.timezones.set_abbreviation_regions,
+            "north_america",
+            "europe",
+            "asia",
+            "australia",
+        )
+        spawn = partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+
+        with mock.patch("delorean.interface.ProcessPoolExecutor", spawn):
+            parsed = delorean.parse_file(path, workers=2, chunk_size=100)
+            streamed = list(
+                delorean.parse_file(path, workers=2, chunk_size=100, stream=True)
+            )
+
+        self.assertEqual(set(parsed.offsets.tolist()), {8 * 3600})
+        self.assertEqual(
+            {d.datetime.utcoffset() for d in streamed}, {timedelta(hours=8)}
+        )
+
+    def test_csv_column_by_index(self):
+        path = self.write('1,"a, b",2015-01-01 00:01:02 -0800\n2,c,2015-01-02\n')
+
+        parsed = delorean.parse_file(path, column=2, workers=1)
+
+        self.assertParsedAs(parsed, ["2015-01-01 00:01:02 -0800", "2015-01-02"])
+
+    def test_csv_column_by_name(self):
+        path = self.write("id;when\n1;2015-01-01\n2;2015-01-02T12:00:00Z\n")
+
+        parsed = delorean.parse_file(path, column="when", delimiter=";", workers=1)
+
+        self.assertParsedAs(parsed, ["2015-01-01", "2015-01-02T12:00:00Z"])
+
+    def test_csv_unknown_column_name(self):
+        path = self.write("id,when\n1,2015-01-01\n")
+
+        with self.assertRaises(ValueError):
+            delorean.parse_file(path, column="at", workers=1)
+
+    def test_csv_header_skipped(self):
+        path = self.write("when\n2015-01-01\n")
+
+        parsed = delorean.parse_file(path, column=0, header=True, workers=1)
+
+        self.assertParsedAs(parsed, ["2015-01-01"])
+
+    def test_jsonl_key(self):
+        path = self.write(
+            '{"at": "2015-01-01T00:00:00+02:00", "n": 1}\n{"at": "2015-01-02"}\n'
+        )
+
+        parsed = delorean.parse_file(path, column="at", workers=1)
+
+        self.assertParsedAs(parsed, ["2015-01-01T00:00:00+02:00", "2015-01-02"])
+
+    def test_jsonl_numeric_epochs(self):
+        path = self.write('{"ts": 1420070400}\n{"ts": 1420070400.5}\n')
+
+        for stream in [False, True]:
+            with self.subTest(stream=stream):
+                parsed = delorean.parse_file(
+                    path, column="ts", epoch_unit="s", workers=1, stream=stream
+                )
+                if stream:
+                    parsed = [d.datetime for d in parsed]
+                else:
+                    parsed = parsed.instants.tolist()
+                    parsed = [dt.replace(tzinfo=timezone.utc) for dt in parsed]
+
+                self.assertEqual(
+                    parsed,
+                    [
+                        datetime(2015, 1, 1, tzinfo=timezone.utc),
+                        datetime(2015, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc),
+                    ],
+                )
+
+    def test_errors_coerce(self):
+        path = self.write('{"at": "2015-01-01"}\n{"other": 1}\n{"at": "asd"}\n')
+
+        parsed = delorean.parse_file(path, column="at", workers=1, errors="coerce")
+
+        self.assertEqual(numpy.isnat(parsed.instants).tolist(), [False, True, True])
+
+    def test_errors_raise(self):
+        path = self.write("2015-01-01\nasd\n")
+
+        with self.assertRaises(ValueError):
+            delorean.parse_file(path, workers=1)
+
+    def test_parse_arguments_apply(self):
+        path = self.write("2015-01-01 10:00\n")
+
+        parsed = delorean.parse_file(path, workers=1, assume_timezone="US/Eastern")
+
+        self.assertEqual(parsed.offsets.tolist(), [-5 * 3600])
+
+    def test_empty_file(self):
+        parsed = delorean.parse_file(self.write(""), workers=1)
+
+        self.assertEqual(len(parsed.instants), 0)
+
+    def test_stream(self):
+        strings = ["2015-01-01T00:00:00Z", "asd", "2015-01-01 00:01:02 -0800"]
+        path = self.write("\n".join(strings))
+
+        results = delorean.parse_file(
+            path, workers=2, chunk_size=10, stream=True, errors="coerce"
+        )
+
+        self.assertEqual(
+            [repr(d) for d in results],
+            [
+                repr(delorean.parse(strings[0])),
+                "None",
+                repr(delorean.parse(strings[2])),
+            ],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()